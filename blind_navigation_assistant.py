@@ -6,10 +6,14 @@ import cv2
 import numpy as np
 import time
 import threading
+import queue
+import itertools
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 from main import ObjectDetectionApp
 from models import DetectedObject, DetectionResult
 import json
+import re
 from datetime import datetime
 
 # Text-to-Speech imports
@@ -28,13 +32,95 @@ except ImportError:
     AUDIO_AVAILABLE = False
     print("⚠️  pygame not available. Install with: pip install pygame")
 
+# Zone-assignment kernel (JIT-compiled when numba is installed)
+from utils_numba import NUMBA_AVAILABLE, assign_zone_cells
+
+
+@dataclass(slots=True)
+class ZoneAnalysis:
+    """Per-zone analysis entry with a fixed slotted layout (cheaper to
+    allocate per frame than a fresh dict per zone)."""
+    object_count: int
+    priority: str
+    objects: List[Tuple[str, str]]
+
+
+# Announcement categories with their cooldown times (seconds). Messages are
+# classified by a single precompiled pattern; anything unmatched is 'OTHER'.
+MESSAGE_CATEGORY_PATTERN = re.compile(r'CAUTION|DANGER|WARNING|Path ahead is clear')
+MESSAGE_COOLDOWNS = {
+    'CAUTION': 0.8,                 # Critical messages - short cooldown
+    'DANGER': 0.8,                  # Critical messages - short cooldown
+    'WARNING': 1.0,                 # Important warnings - medium cooldown
+    'Path ahead is clear': 3.0,     # Longer cooldown to reduce repetition
+    'OTHER': 1.5                    # Other messages - standard cooldown
+}
+
+# Immediate-row zones ordered left to right; bit i of an occupancy mask
+# corresponds to IMMEDIATE_ZONES[i]
+IMMEDIATE_ZONES = ('immediate_far_left', 'immediate_left', 'immediate_center',
+                   'immediate_right', 'immediate_far_right')
+
+# Priority mapping based on distance and position
+ZONE_PRIORITY_MAP = {
+    'immediate_center': 'critical',      # Directly ahead and close
+    'immediate_left': 'high',            # Close left
+    'immediate_right': 'high',           # Close right
+    'mid_center': 'high',                # Ahead at medium distance
+    'immediate_far_left': 'medium',      # Close far left
+    'immediate_far_right': 'medium',     # Close far right
+    'mid_left': 'medium',                # Medium distance left
+    'mid_right': 'medium',               # Medium distance right
+    'mid_far_left': 'low',               # Medium distance far left
+    'mid_far_right': 'low',              # Medium distance far right
+    'far_center': 'medium',              # Far ahead
+    'far_left': 'low',                   # Far left
+    'far_right': 'low',                  # Far right
+    'far_far_left': 'low',               # Far far left
+    'far_far_right': 'low'               # Far far right
+}
+
+# Description mapping for natural language
+ZONE_DESCRIPTION_MAP = {
+    'immediate_center': 'directly ahead',
+    'immediate_left': 'immediate left',
+    'immediate_right': 'immediate right',
+    'immediate_far_left': 'immediate far left',
+    'immediate_far_right': 'immediate far right',
+    'mid_center': 'ahead at medium distance',
+    'mid_left': 'medium distance left',
+    'mid_right': 'medium distance right',
+    'mid_far_left': 'medium distance far left',
+    'mid_far_right': 'medium distance far right',
+    'far_center': 'far ahead',
+    'far_left': 'far left',
+    'far_right': 'far right',
+    'far_far_left': 'far far left',
+    'far_far_right': 'far far right'
+}
+
+# BGR overlay colors per zone priority
+ZONE_PRIORITY_COLORS = {
+    'critical': (0, 0, 255),    # Red
+    'high': (0, 165, 255),      # Orange
+    'medium': (0, 255, 255)     # Yellow
+}
+
 
 class NavigationAssistant:
     """
     Navigation assistant for blind and visually impaired users.
     Provides audio feedback about detected objects and their locations.
     """
-    
+
+    # Safety zone grid dimensions (5 columns x 3 rows for better precision)
+    GRID_COLS = 5
+    GRID_ROWS = 3
+
+    # Zone tables memoized per (width, height), shared by all instances
+    # and seeded at import time for the common resolution
+    _zone_cache: Dict[Tuple[int, int], Dict[str, Dict]] = {}
+
     def __init__(self):
         """Initialize the navigation assistant."""
         # Initialize text-to-speech
@@ -42,15 +128,45 @@ class NavigationAssistant:
         if TTS_AVAILABLE:
             self.tts_engine = pyttsx3.init()
             self._configure_tts()
-        
-        # Initialize audio system
+
+        # Background speech worker so TTS never blocks the detection loop.
+        # The queue is bounded: if speech falls behind, new messages are
+        # dropped rather than accumulating latency. Entries are
+        # (priority, sequence, message) so urgent warnings preempt advice.
+        self._tts_queue = queue.PriorityQueue(maxsize=4)
+        self._tts_seq = itertools.count()
+        if self.tts_engine:
+            self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+            self._tts_thread.start()
+
+        # Initialize audio system. Mono 22 kHz with a 4096-sample buffer:
+        # the larger buffer avoids underruns when the detector loads the
+        # CPU, at the cost of ~23 ms extra latency - imperceptible for
+        # navigation announcements.
         if AUDIO_AVAILABLE:
-            pygame.mixer.init()
+            pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=4096)
         
         # Navigation state
         self.last_announcement_time = {}
         self.announcement_cooldown = 2.5  # Reduced cooldown for better responsiveness
         self.speech_queue = []
+        self._last_feedback_key = None
+        self._last_feedback_time = 0.0
+
+        # Session log (lazily opened JSONL append handle)
+        self._log_fh = None
+        self._log_path = None
+
+        # Pooled per-frame analysis container (see analyze_scene)
+        self._analysis = {
+            'timestamp': 0.0,
+            'total_objects': 0,
+            'zone_analysis': {},
+            'navigation_advice': [],
+            'warnings': [],
+            'objects_by_zone': {},
+            'zone_counts': np.zeros(self.GRID_ROWS * self.GRID_COLS, np.int16)
+        }
         
         # Object tracking
         self.tracked_objects = {}
@@ -60,6 +176,27 @@ class NavigationAssistant:
         self.frame_width = 640
         self.frame_height = 480
         self.zones = self._define_safety_zones()
+
+        # Flat zone index (row * cols + col) per zone name, plus the slice
+        # covering the immediate row, for count-array lookups
+        self._zone_idx = {name: cfg['grid_position'][0] * self.GRID_COLS + cfg['grid_position'][1]
+                          for name, cfg in self.zones.items()}
+        self._immediate_slice = slice(2 * self.GRID_COLS, 3 * self.GRID_COLS)
+
+        # Precompute the advice/warning strings that depend only on which
+        # immediate-row cells are occupied - 32 possible occupancy masks
+        self._movement_advice_table = [self._movement_advice_for_mask(mask)
+                                       for mask in range(32)]
+        self._mask_warning_table = [self._warnings_for_mask(mask)
+                                    for mask in range(32)]
+
+        # Pre-warm the JIT kernel so the first real frame doesn't pay the
+        # compilation cost
+        if NUMBA_AVAILABLE:
+            assign_zone_cells(np.zeros((1, 4), np.int32),
+                              self.frame_width // self.GRID_COLS,
+                              self.frame_height // self.GRID_ROWS,
+                              self.GRID_COLS, self.GRID_ROWS)
         
         # Priority objects for navigation
         self.navigation_objects = {
@@ -93,9 +230,10 @@ class NavigationAssistant:
                         print(f"   Voice {i}: {voice.name}")
                     
                     # Prefer female voice if available (often clearer)
+                    preferred_voice = re.compile(r'female|zira|hazel|susan', re.I)
                     voice_set = False
                     for voice in voices:
-                        if any(keyword in voice.name.lower() for keyword in ['female', 'zira', 'hazel', 'susan']):
+                        if preferred_voice.search(voice.name):
                             self.tts_engine.setProperty('voice', voice.id)
                             print(f"✅ Selected voice: {voice.name}")
                             voice_set = True
@@ -121,56 +259,38 @@ class NavigationAssistant:
     
     def _define_safety_zones(self) -> Dict[str, Dict]:
         """Define enhanced safety zones in the camera frame - 5x3 grid for better accuracy."""
+        # Zone tables are memoized per resolution in a class-level cache
+        # seeded at import time with the common 640x480 case, so most
+        # sessions never build a grid at all
+        cache_key = (self.frame_width, self.frame_height)
+
+        # Grid cell sizes, kept on self so per-frame bucketing doesn't
+        # recompute them
+        self._col_width = self.frame_width // self.GRID_COLS
+        self._row_height = self.frame_height // self.GRID_ROWS
+
+        cached = self._zone_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        zones = self._build_zone_table(self.frame_width, self.frame_height)
+        self._zone_cache[cache_key] = zones
+        return zones
+
+    @classmethod
+    def _build_zone_table(cls, frame_width: int, frame_height: int) -> Dict[str, Dict]:
+        """Build the 5x3 zone table for a frame resolution."""
+        cols = cls.GRID_COLS
+        rows = cls.GRID_ROWS
+        col_width = frame_width // cols
+        row_height = frame_height // rows
+
         zones = {}
-        
-        # Define grid dimensions (5 columns x 3 rows for better precision)
-        cols = 5
-        rows = 3
-        col_width = self.frame_width // cols
-        row_height = self.frame_height // rows
-        
+
         # Zone naming and priorities
         row_names = ['far', 'mid', 'immediate']
         col_names = ['far_left', 'left', 'center', 'right', 'far_right']
-        
-        # Priority mapping based on distance and position
-        priority_map = {
-            'immediate_center': 'critical',      # Directly ahead and close
-            'immediate_left': 'high',            # Close left
-            'immediate_right': 'high',           # Close right  
-            'mid_center': 'high',                # Ahead at medium distance
-            'immediate_far_left': 'medium',      # Close far left
-            'immediate_far_right': 'medium',     # Close far right
-            'mid_left': 'medium',                # Medium distance left
-            'mid_right': 'medium',               # Medium distance right
-            'mid_far_left': 'low',               # Medium distance far left
-            'mid_far_right': 'low',              # Medium distance far right
-            'far_center': 'medium',              # Far ahead
-            'far_left': 'low',                   # Far left
-            'far_right': 'low',                  # Far right
-            'far_far_left': 'low',               # Far far left
-            'far_far_right': 'low'               # Far far right
-        }
-        
-        # Description mapping for natural language
-        description_map = {
-            'immediate_center': 'directly ahead',
-            'immediate_left': 'immediate left',
-            'immediate_right': 'immediate right',
-            'immediate_far_left': 'immediate far left',
-            'immediate_far_right': 'immediate far right',
-            'mid_center': 'ahead at medium distance',
-            'mid_left': 'medium distance left',
-            'mid_right': 'medium distance right',
-            'mid_far_left': 'medium distance far left',
-            'mid_far_right': 'medium distance far right',
-            'far_center': 'far ahead',
-            'far_left': 'far left',
-            'far_right': 'far right',
-            'far_far_left': 'far far left',
-            'far_far_right': 'far far right'
-        }
-        
+
         # Generate all zones
         for row in range(rows):
             for col in range(cols):
@@ -184,8 +304,8 @@ class NavigationAssistant:
                 zone_name = f"{row_names[row]}_{col_names[col]}"
                 
                 # Get priority and description
-                priority = priority_map.get(zone_name, 'low')
-                description = description_map.get(zone_name, zone_name.replace('_', ' '))
+                priority = ZONE_PRIORITY_MAP.get(zone_name, 'low')
+                description = ZONE_DESCRIPTION_MAP.get(zone_name, zone_name.replace('_', ' '))
                 
                 zones[zone_name] = {
                     'x_range': (x_start, x_end),
@@ -194,7 +314,7 @@ class NavigationAssistant:
                     'description': description,
                     'grid_position': (row, col)  # For easier grid-based analysis
                 }
-        
+
         return zones
     
     def analyze_scene(self, detection_result: DetectionResult) -> Dict:
@@ -207,97 +327,121 @@ class NavigationAssistant:
         Returns:
             Dict: Navigation analysis
         """
-        analysis = {
-            'timestamp': time.time(),
-            'total_objects': len(detection_result.objects),
-            'zone_analysis': {},
-            'navigation_advice': [],
-            'warnings': [],
-            'objects_by_zone': {}
-        }
-        
-        # Analyze objects by zone
+        # Reuse one pooled analysis dict across frames: the containers are
+        # cleared and refilled in place instead of reallocated, so a frame's
+        # worth of dicts and the zone-count array never reach the GC.
+        # Consumers treat the result as read-only within the frame; anything
+        # that persists it (e.g. the JSONL log) serializes immediately.
+        analysis = self._analysis
+        analysis['timestamp'] = time.time()
+        analysis['total_objects'] = len(detection_result.objects)
+        analysis['zone_analysis'].clear()
+        analysis['objects_by_zone'].clear()
+        analysis['zone_counts'].fill(0)
+
+        # Resolve color/shape names once per object; advice generation and
+        # drawing read the cached strings instead of re-checking attributes
+        for obj in detection_result.objects:
+            obj.color_name = obj.color.name if obj.color else None
+            obj.shape_name = obj.shape.name if obj.shape else None
+
+        # Assign all objects to grid cells in one vectorized pass, then fill
+        # per-zone analysis, immediate-row counts, and the mid-row occupancy
+        # flag in a single traversal of the zone table
+        buckets = self._bucket_objects_by_cell(detection_result.objects,
+                                               detection_result.bbox_array)
+
+        zone_counts = analysis['zone_counts']
+        immediate_counts = [0] * self.GRID_COLS
+        mid_occupied = False
         for zone_name, zone_config in self.zones.items():
-            zone_objects = self._get_objects_in_zone(detection_result.objects, zone_config)
+            row, col = zone_config['grid_position']
+            zone_objects = buckets.get((row, col), [])
             analysis['objects_by_zone'][zone_name] = zone_objects
-            
+
             if zone_objects:
-                analysis['zone_analysis'][zone_name] = {
-                    'object_count': len(zone_objects),
-                    'priority': zone_config['priority'],
-                    'objects': [(obj.color.name if obj.color else 'unknown', 
-                               obj.shape.name if obj.shape else 'unknown') for obj in zone_objects]
-                }
-        
+                zone_counts[row * self.GRID_COLS + col] = len(zone_objects)
+                if row == 2:
+                    immediate_counts[col] = len(zone_objects)
+                elif row == 1 and 1 <= col <= 3:
+                    mid_occupied = True
+
+                analysis['zone_analysis'][zone_name] = ZoneAnalysis(
+                    object_count=len(zone_objects),
+                    priority=zone_config['priority'],
+                    objects=[(obj.color_name or 'unknown',
+                              obj.shape_name or 'unknown') for obj in zone_objects]
+                )
+
+        mask = 0
+        for col, count in enumerate(immediate_counts):
+            if count:
+                mask |= 1 << col
+
         # Generate navigation advice
-        analysis['navigation_advice'] = self._generate_navigation_advice(analysis)
-        
+        analysis['navigation_advice'] = self._generate_navigation_advice(
+            analysis, mask, mid_occupied)
+
         # Generate warnings
-        analysis['warnings'] = self._generate_warnings(analysis)
-        
+        analysis['warnings'] = self._generate_warnings(
+            analysis, mask, immediate_counts)
+
         return analysis
     
-    def _get_objects_in_zone(self, objects: List[DetectedObject], zone_config: Dict) -> List[DetectedObject]:
-        """Get objects within a specific zone."""
-        zone_objects = []
-        x_min, x_max = zone_config['x_range']
-        y_min, y_max = zone_config['y_range']
-        
-        for obj in objects:
-            # Check if object center is in the zone
-            center_x = obj.bounding_box.x + obj.bounding_box.width // 2
-            center_y = obj.bounding_box.y + obj.bounding_box.height // 2
-            
-            if x_min <= center_x <= x_max and y_min <= center_y <= y_max:
-                zone_objects.append(obj)
-        
-        return zone_objects
+    def _bucket_objects_by_cell(self, objects: List[DetectedObject],
+                                bboxes: Optional[np.ndarray] = None) -> Dict[Tuple[int, int], List[DetectedObject]]:
+        """
+        Assign objects to grid cells using vectorized center-point binning.
+
+        Args:
+            objects: Detected objects to assign
+            bboxes: Optional precomputed (N, 4) [x, y, w, h] array for the
+                objects; built here when not supplied
+
+        Returns:
+            Dict: Mapping of (row, col) grid position to objects in that cell
+        """
+        buckets = {}
+        if not objects:
+            return buckets
+
+        if bboxes is None:
+            # Materialize all bounding boxes as one (N, 4) [x, y, w, h]
+            # array, walking each object's attribute chain exactly once
+            bboxes = np.fromiter(
+                ((obj.bounding_box.x, obj.bounding_box.y,
+                  obj.bounding_box.width, obj.bounding_box.height) for obj in objects),
+                dtype=np.dtype((np.int32, 4)), count=len(objects))
+
+        # Fused center-point + cell-index kernel (JIT-compiled when numba
+        # is installed, vectorized NumPy otherwise)
+        row_idx, col_idx = assign_zone_cells(
+            bboxes, self._col_width, self._row_height,
+            self.GRID_COLS, self.GRID_ROWS)
+
+        # tolist() yields plain Python ints, avoiding per-element NumPy
+        # scalar boxing in the grouping loop
+        for obj, row, col in zip(objects, row_idx.tolist(), col_idx.tolist()):
+            buckets.setdefault((row, col), []).append(obj)
+
+        return buckets
     
-    def _generate_navigation_advice(self, analysis: Dict) -> List[str]:
-        """Generate enhanced navigation advice based on 5x3 grid analysis."""
+    @staticmethod
+    def _immediate_mask(objects_by_zone: Dict) -> int:
+        """Encode immediate-row occupancy as a 5-bit mask (bit i = zone i occupied)."""
+        mask = 0
+        for i, zone in enumerate(IMMEDIATE_ZONES):
+            if objects_by_zone.get(zone):
+                mask |= 1 << i
+        return mask
+
+    @staticmethod
+    def _movement_advice_for_mask(mask: int) -> Tuple[str, ...]:
+        """Compute the canned movement advice for an immediate-row occupancy mask."""
+        clear_zones = [zone for i, zone in enumerate(IMMEDIATE_ZONES)
+                       if not mask & (1 << i)]
+
         advice = []
-        
-        # Priority zones for immediate navigation (bottom row - closest to user)
-        immediate_zones = ['immediate_far_left', 'immediate_left', 'immediate_center', 'immediate_right', 'immediate_far_right']
-        
-        # Check critical center zone first
-        if 'immediate_center' in analysis['objects_by_zone'] and analysis['objects_by_zone']['immediate_center']:
-            objects = analysis['objects_by_zone']['immediate_center']
-            zone_desc = self.zones['immediate_center']['description']
-            
-            if len(objects) == 1:
-                obj = objects[0]
-                color = obj.color.name if obj.color else 'unknown color'
-                shape = obj.shape.name if obj.shape else 'object'
-                advice.append(f"{color} {shape} {zone_desc}")
-            else:
-                advice.append(f"{len(objects)} objects {zone_desc}")
-        
-        # Check immediate side zones
-        for zone in ['immediate_left', 'immediate_right', 'immediate_far_left', 'immediate_far_right']:
-            if zone in analysis['objects_by_zone'] and analysis['objects_by_zone'][zone]:
-                objects = analysis['objects_by_zone'][zone]
-                zone_desc = self.zones[zone]['description']
-                
-                if len(objects) == 1:
-                    obj = objects[0]
-                    color = obj.color.name if obj.color else 'unknown color'
-                    shape = obj.shape.name if obj.shape else 'object'
-                    advice.append(f"{color} {shape} {zone_desc}")
-                elif len(objects) > 1:
-                    advice.append(f"{len(objects)} objects {zone_desc}")
-        
-        # Enhanced path guidance with more precision
-        clear_zones = []
-        blocked_zones = []
-        
-        for zone in immediate_zones:
-            if zone not in analysis['objects_by_zone'] or not analysis['objects_by_zone'][zone]:
-                clear_zones.append(zone)
-            else:
-                blocked_zones.append(zone)
-        
-        # Generate sophisticated movement advice
         if clear_zones:
             if 'immediate_center' in clear_zones:
                 # Check if sides are also clear for "straight ahead" advice
@@ -319,75 +463,127 @@ class NavigationAssistant:
                 advice.append("Move far left to avoid obstacles")
             elif 'immediate_far_right' in clear_zones:
                 advice.append("Move far right to avoid obstacles")
-        
+
+        return tuple(advice)
+
+    @staticmethod
+    def _warnings_for_mask(mask: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Compute the canned warnings for an immediate-row occupancy mask.
+
+        Returns three segments (head, narrow-passage, edge) so dynamic
+        count-based warnings can be interleaved in the original order.
+        """
+        occupied = {zone for i, zone in enumerate(IMMEDIATE_ZONES) if mask & (1 << i)}
+
+        # Critical and high priority zone warnings
+        head = []
+        if 'immediate_center' in occupied:
+            head.append("CAUTION: Obstacle directly ahead")
+        for zone in ('immediate_left', 'immediate_right'):
+            if zone in occupied:
+                head.append(f"WARNING: Objects {ZONE_DESCRIPTION_MAP[zone]}")
+
+        # Narrow passage detection
+        narrow = []
+        center_blocked = 'immediate_center' in occupied
+        left_blocked = 'immediate_left' in occupied
+        right_blocked = 'immediate_right' in occupied
+        if center_blocked and (left_blocked or right_blocked):
+            if left_blocked and right_blocked:
+                narrow.append("BLOCKED: No clear path ahead")
+            elif left_blocked:
+                narrow.append("Narrow passage: Only right side available")
+            elif right_blocked:
+                narrow.append("Narrow passage: Only left side available")
+
+        # Edge zone warnings (far left/right)
+        edge = []
+        for zone in ('immediate_far_left', 'immediate_far_right'):
+            if zone in occupied:
+                edge.append(f"Edge obstacle: {ZONE_DESCRIPTION_MAP[zone]}")
+
+        return tuple(head), tuple(narrow), tuple(edge)
+
+    def _generate_navigation_advice(self, analysis: Dict,
+                                    mask: Optional[int] = None,
+                                    mid_occupied: Optional[bool] = None) -> List[str]:
+        """Generate enhanced navigation advice based on 5x3 grid analysis."""
+        advice = []
+        objects_by_zone = analysis['objects_by_zone']
+
+        # Recompute primitives only if the caller didn't supply them
+        if mask is None:
+            mask = self._immediate_mask(objects_by_zone)
+        if mid_occupied is None:
+            mid_occupied = any(objects_by_zone.get(zone)
+                               for zone in ('mid_left', 'mid_center', 'mid_right'))
+
+        # Object-specific descriptions, critical center zone first
+        for zone in ('immediate_center', 'immediate_left', 'immediate_right',
+                     'immediate_far_left', 'immediate_far_right'):
+            objects = objects_by_zone.get(zone)
+            if objects:
+                zone_desc = self.zones[zone]['description']
+                if len(objects) == 1:
+                    obj = objects[0]
+                    color = obj.color_name or 'unknown color'
+                    shape = obj.shape_name or 'object'
+                    advice.append(f"{color} {shape} {zone_desc}")
+                else:
+                    advice.append(f"{len(objects)} objects {zone_desc}")
+
+        # Movement advice is a pure function of immediate-row occupancy,
+        # looked up from the precomputed table
+        advice.extend(self._movement_advice_table[mask])
+
         # Check medium distance zones for advanced planning
-        mid_zones_blocked = []
-        for zone in ['mid_left', 'mid_center', 'mid_right']:
-            if zone in analysis['objects_by_zone'] and analysis['objects_by_zone'][zone]:
-                mid_zones_blocked.append(zone)
-        
-        if mid_zones_blocked and not blocked_zones:  # Clear immediate but blocked ahead
+        if mask == 0 and mid_occupied:  # Clear immediate row but blocked ahead
             advice.append("Obstacles ahead at medium distance - plan your path")
-        
+
         return advice
-    
-    def _generate_warnings(self, analysis: Dict) -> List[str]:
+
+    def _generate_warnings(self, analysis: Dict,
+                           mask: Optional[int] = None,
+                           immediate_counts: Optional[List[int]] = None) -> List[str]:
         """Generate enhanced safety warnings based on 5x3 grid analysis."""
-        warnings = []
-        
-        # Critical zone warnings (immediate center - directly ahead)
-        critical_objects = analysis['objects_by_zone'].get('immediate_center', [])
-        if critical_objects:
-            warnings.append("CAUTION: Obstacle directly ahead")
-        
-        # High priority zone warnings (immediate left/right)
-        immediate_side_zones = ['immediate_left', 'immediate_right']
-        for zone in immediate_side_zones:
-            objects = analysis['objects_by_zone'].get(zone, [])
-            if objects:
-                zone_desc = self.zones[zone]['description']
-                warnings.append(f"WARNING: Objects {zone_desc}")
-        
+        objects_by_zone = analysis['objects_by_zone']
+
+        # Recompute the immediate-row primitives only if the caller didn't
+        # supply them from the fused analysis pass
+        if immediate_counts is None:
+            immediate_counts = [len(objects_by_zone.get(zone, [])) for zone in IMMEDIATE_ZONES]
+        if mask is None:
+            mask = 0
+            for i, count in enumerate(immediate_counts):
+                if count:
+                    mask |= 1 << i
+
+        # Mask-dependent warnings come from the precomputed table
+        head, narrow, edge = self._mask_warning_table[mask]
+        warnings = list(head)
+
         # Multiple object warnings with enhanced granularity
-        immediate_zones = ['immediate_far_left', 'immediate_left', 'immediate_center', 'immediate_right', 'immediate_far_right']
-        total_immediate = sum(len(analysis['objects_by_zone'].get(zone, [])) for zone in immediate_zones)
-        
+        total_immediate = sum(immediate_counts)
         if total_immediate >= 4:
             warnings.append("DANGER: Multiple obstacles in immediate area")
         elif total_immediate >= 2:
             warnings.append("Multiple obstacles detected nearby")
-        
-        # Narrow passage detection
-        center_blocked = bool(analysis['objects_by_zone'].get('immediate_center', []))
-        left_blocked = bool(analysis['objects_by_zone'].get('immediate_left', []))
-        right_blocked = bool(analysis['objects_by_zone'].get('immediate_right', []))
-        
-        # Check for narrow passages
-        if center_blocked and (left_blocked or right_blocked):
-            if left_blocked and right_blocked:
-                warnings.append("BLOCKED: No clear path ahead")
-            elif left_blocked:
-                warnings.append("Narrow passage: Only right side available")
-            elif right_blocked:
-                warnings.append("Narrow passage: Only left side available")
-        
-        # Far zone early warnings for planning
-        far_center_objects = analysis['objects_by_zone'].get('far_center', [])
-        if far_center_objects and not critical_objects:
+
+        warnings.extend(narrow)
+
+        # Far zone early warnings for planning - scalar count check when the
+        # per-frame count array is available
+        zone_counts = analysis.get('zone_counts')
+        if zone_counts is not None:
+            far_center_blocked = bool(zone_counts[self._zone_idx['far_center']])
+        else:
+            far_center_blocked = bool(objects_by_zone.get('far_center'))
+        if far_center_blocked and not mask & (1 << 2):
             warnings.append("Obstacle approaching ahead - prepare to navigate")
-        
-        # Edge zone warnings (far left/right)
-        edge_zones = ['immediate_far_left', 'immediate_far_right']
-        for zone in edge_zones:
-            objects = analysis['objects_by_zone'].get(zone, [])
-            if objects:
-                zone_desc = self.zones[zone]['description']
-                warnings.append(f"Edge obstacle: {zone_desc}")
-        
-        return warnings
-        if total_immediate >= 3:
-            warnings.append("Multiple obstacles detected nearby")
-        
+
+        warnings.extend(edge)
+
         return warnings
     
     def provide_audio_feedback(self, analysis: Dict):
@@ -395,7 +591,19 @@ class NavigationAssistant:
         # Skip audio feedback if no objects detected (reduces "Path ahead is clear" spam)
         if analysis['total_objects'] == 0:
             return
-        
+
+        # Early exit for unchanged scenes: if the warnings/advice match the
+        # previous frame and we're still inside the cooldown window, skip
+        # all the message assembly below
+        feedback_key = (tuple(analysis['warnings']),
+                        tuple(analysis['navigation_advice'][:2]))
+        current_time = time.time()
+        if (feedback_key == self._last_feedback_key
+                and current_time - self._last_feedback_time < self.announcement_cooldown):
+            return
+        self._last_feedback_key = feedback_key
+        self._last_feedback_time = current_time
+
         print(f"🔊 Providing audio feedback... TTS available: {self.tts_engine is not None}")
         
         if not self.tts_engine:
@@ -412,8 +620,11 @@ class NavigationAssistant:
             print(f"   Added warning: {warning}")
         
         # Add navigation advice only if there are warnings or important objects
-        immediate_zones = ['immediate_left', 'immediate_center', 'immediate_right', 'immediate_far_left', 'immediate_far_right']
-        has_immediate_objects = any(zone in analysis['zone_analysis'] for zone in immediate_zones)
+        zone_counts = analysis.get('zone_counts')
+        if zone_counts is not None:
+            has_immediate_objects = bool(zone_counts[self._immediate_slice].any())
+        else:
+            has_immediate_objects = any(zone in analysis['zone_analysis'] for zone in IMMEDIATE_ZONES)
         
         if has_immediate_objects or len(analysis['warnings']) > 0:
             for advice in analysis['navigation_advice'][:1]:  # Only 1 piece of advice at a time
@@ -430,42 +641,61 @@ class NavigationAssistant:
             self._speak_message(most_important)
     
     def _speak_message(self, message: str):
-        """Speak a message using TTS with improved cooldown management."""
+        """Speak a message using TTS with per-category cooldown management."""
         current_time = time.time()
-        
-        # Different cooldown times based on message importance
-        if "CAUTION" in message or "DANGER" in message:
-            cooldown = 0.8  # Critical messages - short cooldown
-        elif "WARNING" in message:
-            cooldown = 1.0  # Important warnings - medium cooldown
-        elif "Path ahead is clear" in message:
-            cooldown = 3.0  # Path clear messages - longer cooldown to reduce repetition
-        else:
-            cooldown = 1.5  # Other messages - standard cooldown
-        
+
+        # Classify the message once; cooldowns are tracked per category so
+        # the tracking dict stays bounded at five keys instead of growing
+        # with every distinct dynamic message
+        match = MESSAGE_CATEGORY_PATTERN.search(message)
+        category = match.group(0) if match else 'OTHER'
+        cooldown = MESSAGE_COOLDOWNS[category]
+
         # Check cooldown to avoid spam
-        if message in self.last_announcement_time:
-            if current_time - self.last_announcement_time[message] < cooldown:
-                return
-        
-        self.last_announcement_time[message] = current_time
-        
-        print(f"🔊 Speaking: {message}")  # Debug output
-        
+        last_time = self.last_announcement_time.get(category)
+        if last_time is not None and current_time - last_time < cooldown:
+            return
+
+        self.last_announcement_time[category] = current_time
+
         if self.tts_engine:
+            # Hand the message to the background worker and return
+            # immediately. Urgent warnings sort ahead of queued advice; the
+            # sequence number keeps same-priority messages in FIFO order.
+            priority = 0 if category in ('CAUTION', 'DANGER') else 1
+            entry = (priority, next(self._tts_seq), message)
+            try:
+                self._tts_queue.put_nowait(entry)
+            except queue.Full:
+                if priority == 0:
+                    # Make room for the urgent message by dropping the
+                    # next queued one
+                    try:
+                        self._tts_queue.get_nowait()
+                        self._tts_queue.task_done()
+                        self._tts_queue.put_nowait(entry)
+                    except (queue.Empty, queue.Full):
+                        pass
+                # Non-urgent speech is backed up - drop it instead of stalling
+        else:
+            # Fallback to console output when TTS is unavailable
+            print(f"📢 AUDIO: {message}")
+
+    def _tts_worker(self):
+        """Background worker that speaks queued messages one at a time."""
+        while True:
+            _, _, message = self._tts_queue.get()
+            print(f"🔊 Speaking: {message}")  # Debug output
             try:
-                # Simple, reliable approach
                 self.tts_engine.say(message)
                 self.tts_engine.runAndWait()
                 print(f"✅ Spoke: {message}")  # Debug confirmation
-                
             except Exception as e:
                 print(f"❌ TTS error: {e}")
                 # Fallback to console output
                 print(f"📢 AUDIO: {message}")
-        else:
-            # Fallback to console output when TTS is unavailable
-            print(f"📢 AUDIO: {message}")
+            finally:
+                self._tts_queue.task_done()
     
     def _print_feedback(self, analysis: Dict):
         """Print feedback to console when TTS is not available."""
@@ -484,35 +714,64 @@ class NavigationAssistant:
                 print(f"📍 {zone_desc}: {len(objects)} object(s)")
     
     def save_navigation_log(self, analysis: Dict, filename: str = None):
-        """Save navigation analysis to a log file."""
+        """Append navigation analysis to a JSON-lines log file."""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"navigation_log_{timestamp}.json"
-        
+            if self._log_path is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                self._log_path = f"navigation_log_{timestamp}.jsonl"
+            filename = self._log_path
+
+        # Project the analysis onto JSON-native values: the raw dict
+        # carries ZoneAnalysis instances, DetectedObject lists and a
+        # zone-count ndarray whose reprs would bloat every line and come
+        # back from load_navigation_log as opaque strings
         log_entry = {
             'timestamp': datetime.fromtimestamp(analysis['timestamp']).isoformat(),
-            'analysis': analysis
+            'total_objects': analysis['total_objects'],
+            'zones': {
+                zone: {
+                    'object_count': zone_info.object_count,
+                    'priority': zone_info.priority,
+                    'objects': zone_info.objects,
+                }
+                for zone, zone_info in analysis['zone_analysis'].items()
+            },
+            'warnings': analysis['warnings'],
+            'navigation_advice': analysis['navigation_advice'],
         }
-        
+
         try:
-            # Try to load existing log
-            try:
-                with open(filename, 'r') as f:
-                    log_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                log_data = {'sessions': []}
-            
-            # Add new entry
-            log_data['sessions'].append(log_entry)
-            
-            # Save updated log
-            with open(filename, 'w') as f:
-                json.dump(log_data, f, indent=2)
-                
+            # Keep one line-buffered handle open in append mode for the
+            # whole session - O(1) per write and no per-call open/close
+            if self._log_fh is None or self._log_fh.name != filename:
+                if self._log_fh is not None:
+                    self._log_fh.close()
+                self._log_fh = open(filename, 'a', buffering=1)
+            self._log_fh.write(json.dumps(log_entry, separators=(',', ':'))
+                               + '\n')
         except Exception as e:
             print(f"Error saving navigation log: {e}")
 
 
+# Specialize the overwhelmingly common camera resolution at import time so
+# the first NavigationAssistant hits the cache instead of building zones
+NavigationAssistant._zone_cache[(640, 480)] = NavigationAssistant._build_zone_table(640, 480)
+
+
+def load_navigation_log(filename: str) -> List[Dict]:
+    """
+    Load a JSON-lines navigation log written by save_navigation_log.
+
+    Args:
+        filename: Path to the .jsonl log file
+
+    Returns:
+        List[Dict]: Parsed log entries in write order
+    """
+    with open(filename) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
 class BlindNavigationApp(ObjectDetectionApp):
     """
     Extended object detection app for blind navigation assistance.
@@ -523,6 +782,51 @@ class BlindNavigationApp(ObjectDetectionApp):
         super().__init__()
         self.navigation_assistant = NavigationAssistant()
         self.window_name = "Blind Navigation Assistant"
+
+        # Cached zone overlay - the grid is static per resolution, so it is
+        # rasterized once and blitted instead of redrawn every frame
+        self._zone_overlay = None
+        self._zone_overlay_mask = None
+
+        # Label sizes only depend on the color x shape text, so measured
+        # extents are memoized across frames
+        self._text_size_cache = {}
+
+        # Cached navigation info panel, rebuilt only when the scene summary
+        # text changes
+        self._info_overlay = None
+        self._info_overlay_mask = None
+        self._info_overlay_key = None
+
+        # Visualization throttle - detection and audio run uncapped while
+        # drawing/imshow are limited to ~30 FPS
+        self._last_vis_time = 0.0
+        self._vis_period = 1.0 / 30.0
+
+        # Run the full detector every N frames and reuse the last result
+        # (with cached color/shape analysis) on the frames in between
+        self._detection_interval = 3
+        self._detection_frame_idx = 0
+        self._last_detected_objects = None
+
+        # Motion-gated ROI detection: restrict the detector to the region
+        # covering inter-frame motion plus recent detections
+        self._motion_scale = 4
+        self._motion_threshold = 25
+        self._motion_roi_margin = 20
+        self._prev_gray_small = None
+        self._motion_dilate_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+
+        # Life-cycle tracks: detections are matched to tracks by IoU and
+        # only announced once seen on several consecutive detection passes,
+        # then held briefly after disappearing. Thresholds are in detection
+        # passes (one per _detection_interval frames), so 3 hits / 5 misses
+        # is roughly 0.4 s to confirm and 0.6 s of hold at 25 FPS.
+        self._tracks = {}
+        self._next_track_id = 0
+        self._track_iou_threshold = 0.3
+        self._track_confirm_hits = 3
+        self._track_max_misses = 5
         
         # Override display settings for accessibility
         self.display_config.update({
@@ -542,25 +846,174 @@ class BlindNavigationApp(ObjectDetectionApp):
         print("  • Press 'v' to toggle voice feedback")
         print("  • Press 's' to save navigation log")
     
+    @staticmethod
+    def _bbox_iou(a, b) -> float:
+        """Intersection-over-union of two BoundingBox instances."""
+        x0 = max(a.x, b.x)
+        y0 = max(a.y, b.y)
+        x1 = min(a.x + a.width, b.x + b.width)
+        y1 = min(a.y + a.height, b.y + b.height)
+        if x1 <= x0 or y1 <= y0:
+            return 0.0
+        intersection = (x1 - x0) * (y1 - y0)
+        union = a.width * a.height + b.width * b.height - intersection
+        return intersection / union
+
+    def _update_tracks(self, detections: List[DetectedObject]) -> List[DetectedObject]:
+        """
+        Match detections to life-cycle tracks and return the stable set.
+
+        Each detection is greedily matched to the best-overlapping track.
+        Tracks gain a hit on match and a miss otherwise; they only count as
+        real objects after several consecutive hits, and a confirmed track
+        is held through short dropouts so one flickering detection doesn't
+        retrigger speech.
+
+        Args:
+            detections: Raw detector output for this pass
+
+        Returns:
+            List[DetectedObject]: Objects from confirmed tracks
+        """
+        unmatched = set(self._tracks)
+        for obj in detections:
+            best_id = None
+            best_iou = self._track_iou_threshold
+            for track_id in unmatched:
+                iou = self._bbox_iou(obj.bounding_box,
+                                     self._tracks[track_id]['obj'].bounding_box)
+                if iou > best_iou:
+                    best_iou = iou
+                    best_id = track_id
+
+            if best_id is not None:
+                track = self._tracks[best_id]
+                track['obj'] = obj
+                track['hits'] += 1
+                track['misses'] = 0
+                unmatched.discard(best_id)
+            else:
+                self._tracks[self._next_track_id] = {'obj': obj, 'hits': 1,
+                                                     'misses': 0}
+                self._next_track_id += 1
+
+        for track_id in unmatched:
+            track = self._tracks[track_id]
+            track['misses'] += 1
+            if track['misses'] > self._track_max_misses:
+                del self._tracks[track_id]
+
+        return [track['obj'] for track in self._tracks.values()
+                if track['hits'] >= self._track_confirm_hits]
+
+    def _compute_motion_roi(self, frame: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Compute a detection ROI covering inter-frame motion and recent detections.
+
+        Args:
+            frame: Current BGR frame
+
+        Returns:
+            Optional[Tuple]: (x0, y0, x1, y1) ROI in frame coordinates, or
+            None when the full frame should be processed
+        """
+        frame_height, frame_width = frame.shape[:2]
+        scale = self._motion_scale
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, (frame_width // scale, frame_height // scale))
+
+        prev = self._prev_gray_small
+        self._prev_gray_small = small
+        if prev is None or prev.shape != small.shape:
+            return None
+
+        # Threshold the downscaled frame difference to find moving regions
+        diff = cv2.absdiff(small, prev)
+        _, mask = cv2.threshold(diff, self._motion_threshold, 255, cv2.THRESH_BINARY)
+        mask = cv2.dilate(mask, self._motion_dilate_kernel)
+
+        boxes = []
+        points = cv2.findNonZero(mask)
+        if points is not None:
+            x, y, w, h = cv2.boundingRect(points)
+            # Widespread motion (e.g. the user walking) - scan the full frame
+            if w * h > 0.5 * mask.size:
+                return None
+            boxes.append((x * scale, y * scale, (x + w) * scale, (y + h) * scale))
+
+        # Union with the expanded boxes of every live track (confirmed or
+        # not) so stationary and still-confirming objects aren't lost
+        # between motion events
+        margin = self._motion_roi_margin
+        for track in self._tracks.values():
+            bbox = track['obj'].bounding_box
+            boxes.append((bbox.x - margin, bbox.y - margin,
+                          bbox.x + bbox.width + margin,
+                          bbox.y + bbox.height + margin))
+
+        if not boxes:
+            return None
+
+        x0 = max(0, min(box[0] for box in boxes))
+        y0 = max(0, min(box[1] for box in boxes))
+        x1 = min(frame_width, max(box[2] for box in boxes))
+        y1 = min(frame_height, max(box[3] for box in boxes))
+        if x1 <= x0 or y1 <= y0:
+            return None
+
+        return x0, y0, x1, y1
+
     def _process_frame(self) -> None:
         """Process frame with navigation assistance."""
-        # Capture frame
+        # The camera's grabber thread publishes latest-wins frames, so
+        # this always consumes the freshest one
         frame = self.camera.capture_frame()
         if frame is None:
             return
         
-        # Update frame dimensions for navigation assistant
-        self.navigation_assistant.frame_height, self.navigation_assistant.frame_width = frame.shape[:2]
-        self.navigation_assistant.zones = self.navigation_assistant._define_safety_zones()
-        
-        # Detect objects
-        detected_objects = self.detector.detect_objects(frame)
-        
-        # Analyze colors and shapes for each detected object
-        for obj in detected_objects:
-            obj.color = self.color_analyzer.analyze_color(frame, obj)
-            obj.shape = self.shape_analyzer.analyze_shape(obj)
-        
+        # Rebuild navigation zones only when the frame resolution changes
+        frame_height, frame_width = frame.shape[:2]
+        nav = self.navigation_assistant
+        if (frame_width, frame_height) != (nav.frame_width, nav.frame_height):
+            nav.frame_width = frame_width
+            nav.frame_height = frame_height
+            nav.zones = nav._define_safety_zones()
+        
+        # Detect objects on every Nth frame; reuse the previous result with
+        # its cached color/shape analysis in between
+        run_detection = (self._last_detected_objects is None
+                         or self._detection_frame_idx % self._detection_interval == 0)
+        self._detection_frame_idx += 1
+
+        if run_detection:
+            roi = self._compute_motion_roi(frame)
+            if roi is None:
+                detected_objects = self.detector.detect_objects(frame)
+            else:
+                # Detect only inside the motion ROI and shift the results
+                # back to full-frame coordinates
+                x0, y0, x1, y1 = roi
+                detected_objects = self.detector.detect_objects(frame[y0:y1, x0:x1])
+                offset = np.array([x0, y0], dtype=np.int32)
+                for obj in detected_objects:
+                    obj.bounding_box.x += x0
+                    obj.bounding_box.y += y0
+                    obj.contour += offset
+
+            # Analyze colors and shapes for all detected objects in one batch
+            colors = self.color_analyzer.analyze_colors(frame, detected_objects)
+            shapes = self.shape_analyzer.analyze_shapes(detected_objects)
+            for obj, color, shape in zip(detected_objects, colors, shapes):
+                obj.color = color
+                obj.shape = shape
+
+            # Smooth the raw detections through the life-cycle tracker so
+            # downstream analysis and speech see a stable object set
+            detected_objects = self._update_tracks(detected_objects)
+            self._last_detected_objects = detected_objects
+        else:
+            detected_objects = self._last_detected_objects
+
         # Create detection result
         detection_result = DetectionResult(
             objects=detected_objects,
@@ -576,31 +1029,36 @@ class BlindNavigationApp(ObjectDetectionApp):
             print(f"🎯 Navigation Analysis: {navigation_analysis['total_objects']} objects detected")
             print(f"   Zones with objects: {len(navigation_analysis['zone_analysis'])}")
             for zone, info in navigation_analysis['zone_analysis'].items():
-                print(f"   {zone}: {info['object_count']} objects ({info['priority']} priority)")
+                print(f"   {zone}: {info.object_count} objects ({info.priority} priority)")
         
         # Provide audio feedback
         self.navigation_assistant.provide_audio_feedback(navigation_analysis)
-        
-        # Visualize results with navigation zones
-        display_frame = self._visualize_navigation_results(detection_result, navigation_analysis)
-        
-        # Show frame
-        cv2.imshow(self.window_name, display_frame)
-        
+
+        # Visualize results with navigation zones, throttled so rendering
+        # never becomes the pipeline bottleneck
+        now = time.time()
+        if now - self._last_vis_time >= self._vis_period:
+            display_frame = self._visualize_navigation_results(detection_result, navigation_analysis)
+            cv2.imshow(self.window_name, display_frame)
+            self._last_vis_time = now
+
         # Update frame counter and FPS
         self._update_fps()
     
     def _visualize_navigation_results(self, detection_result: DetectionResult, 
                                     navigation_analysis: Dict) -> np.ndarray:
         """Visualize results with navigation zones and accessibility features."""
-        frame = detection_result.frame.copy()
-        
+        # Draw directly on the captured buffer: nothing reads the pristine
+        # frame after visualization, so the full-frame copy is pure overhead
+        frame = detection_result.frame
+
         # Draw navigation zones
         if self.display_config.get('show_zones', True):
             frame = self._draw_navigation_zones(frame)
         
         # Draw objects with enhanced visibility
-        frame = self._draw_accessible_objects(frame, detection_result.objects)
+        frame = self._draw_accessible_objects(frame, detection_result.objects,
+                                              detection_result.bbox_array)
         
         # Draw navigation information
         if self.display_config.get('show_navigation_info', True):
@@ -608,82 +1066,130 @@ class BlindNavigationApp(ObjectDetectionApp):
         
         return frame
     
-    def _draw_navigation_zones(self, frame: np.ndarray) -> np.ndarray:
-        """Draw navigation safety zones."""
+    def _build_zone_overlay(self, shape: Tuple[int, ...]) -> None:
+        """Rasterize the zone grid and labels once into a cached overlay."""
         zones = self.navigation_assistant.zones
-        
-        zone_colors = {
-            'critical': (0, 0, 255),    # Red
-            'high': (0, 165, 255),      # Orange
-            'medium': (0, 255, 255)     # Yellow
-        }
-        
+        zone_colors = ZONE_PRIORITY_COLORS
+
+        overlay = np.zeros(shape, dtype=np.uint8)
         for zone_name, zone_config in zones.items():
             x_min, x_max = zone_config['x_range']
             y_min, y_max = zone_config['y_range']
             priority = zone_config['priority']
-            
+
             color = zone_colors.get(priority, (128, 128, 128))
-            
+
             # Draw zone boundary
-            cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), color, 2)
-            
+            cv2.rectangle(overlay, (x_min, y_min), (x_max, y_max), color, 2)
+
             # Draw zone label
             label = f"{zone_name.replace('_', ' ').title()}"
-            cv2.putText(frame, label, (x_min + 5, y_min + 20),
+            cv2.putText(overlay, label, (x_min + 5, y_min + 20),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
-        
+
+        self._zone_overlay = overlay
+        self._zone_overlay_mask = overlay.any(axis=2, keepdims=True)
+
+    def _draw_navigation_zones(self, frame: np.ndarray) -> np.ndarray:
+        """Draw navigation safety zones by blitting the cached overlay."""
+        if self._zone_overlay is None or self._zone_overlay.shape != frame.shape:
+            self._build_zone_overlay(frame.shape)
+
+        # Single masked copy instead of 15 rectangle + 15 text calls
+        np.copyto(frame, self._zone_overlay, where=self._zone_overlay_mask)
         return frame
     
-    def _draw_accessible_objects(self, frame: np.ndarray, objects: List[DetectedObject]) -> np.ndarray:
+    def _draw_accessible_objects(self, frame: np.ndarray, objects: List[DetectedObject],
+                                 bboxes: Optional[np.ndarray] = None) -> np.ndarray:
         """Draw objects with high contrast for accessibility."""
+        if not objects:
+            return frame
+
+        if bboxes is None:
+            bboxes = np.array([(obj.bounding_box.x, obj.bounding_box.y,
+                                obj.bounding_box.width, obj.bounding_box.height)
+                               for obj in objects], np.int32).reshape(-1, 4)
+
+        # Draw all thick, high-contrast bounding boxes with one polylines
+        # call over an (N, 4, 2) corner array derived from the shared
+        # bbox array without touching the Python objects
+        x0 = bboxes[:, 0]
+        y0 = bboxes[:, 1]
+        x1 = x0 + bboxes[:, 2]
+        y1 = y0 + bboxes[:, 3]
+        corners = np.stack((np.stack((x0, y0), axis=1),
+                            np.stack((x1, y0), axis=1),
+                            np.stack((x1, y1), axis=1),
+                            np.stack((x0, y1), axis=1)), axis=1)
+        cv2.polylines(frame, corners, True, (0, 255, 0), 4)  # Thick green border
+
         for obj in objects:
-            # Draw thick, high-contrast bounding box
             bbox = obj.bounding_box
-            cv2.rectangle(frame, 
-                         (bbox.x, bbox.y), 
-                         (bbox.x + bbox.width, bbox.y + bbox.height),
-                         (0, 255, 0), 4)  # Thick green border
-            
+
             # Draw filled background for text
-            if obj.color and obj.shape:
-                text = f"{obj.color.name} {obj.shape.name}"
-                text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
-                
+            if obj.color_name and obj.shape_name:
+                text = f"{obj.color_name} {obj.shape_name}"
+                text_size = self._text_size_cache.get(text)
+                if text_size is None:
+                    text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
+                    self._text_size_cache[text] = text_size
+
                 # Black background for text
                 cv2.rectangle(frame,
                              (bbox.x, bbox.y - text_size[1] - 10),
                              (bbox.x + text_size[0] + 10, bbox.y),
                              (0, 0, 0), -1)
-                
+
                 # White text for maximum contrast
                 cv2.putText(frame, text, (bbox.x + 5, bbox.y - 5),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-        
+
         return frame
     
-    def _draw_navigation_info(self, frame: np.ndarray, analysis: Dict) -> np.ndarray:
-        """Draw navigation information on frame."""
+    def _build_info_overlay(self, width: int, analysis: Dict) -> None:
+        """Rasterize the navigation info panel into a cached strip."""
+        warnings = analysis['warnings']
+        advice = analysis['navigation_advice'][:3]  # Show max 3 lines
+
+        height = 50 + 30 * len(warnings) + 25 * len(advice)
+        overlay = np.zeros((height, width, 3), dtype=np.uint8)
         y_offset = 30
-        
+
         # Object count
         count_text = f"Objects: {analysis['total_objects']}"
-        cv2.putText(frame, count_text, (10, y_offset),
+        cv2.putText(overlay, count_text, (10, y_offset),
                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
         y_offset += 40
-        
+
         # Warnings
-        for warning in analysis['warnings']:
-            cv2.putText(frame, f"WARNING: {warning}", (10, y_offset),
+        for warning in warnings:
+            cv2.putText(overlay, f"WARNING: {warning}", (10, y_offset),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
             y_offset += 30
-        
+
         # Navigation advice
-        for advice in analysis['navigation_advice'][:3]:  # Show max 3 lines
-            cv2.putText(frame, advice, (10, y_offset),
+        for line in advice:
+            cv2.putText(overlay, line, (10, y_offset),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
             y_offset += 25
-        
+
+        self._info_overlay = overlay
+        self._info_overlay_mask = overlay.any(axis=2, keepdims=True)
+
+    def _draw_navigation_info(self, frame: np.ndarray, analysis: Dict) -> np.ndarray:
+        """Draw navigation information by blitting a cached text panel."""
+        # The panel text only changes when the scene summary changes, so
+        # the putText calls are paid once per distinct summary and the
+        # steady state is a single masked copy
+        key = (analysis['total_objects'], tuple(analysis['warnings']),
+               tuple(analysis['navigation_advice'][:3]), frame.shape[1])
+        if key != self._info_overlay_key:
+            self._build_info_overlay(frame.shape[1], analysis)
+            self._info_overlay_key = key
+
+        rows = min(self._info_overlay.shape[0], frame.shape[0])
+        np.copyto(frame[:rows], self._info_overlay[:rows],
+                  where=self._info_overlay_mask[:rows])
         return frame
     
     def run(self) -> None:
@@ -696,19 +1202,14 @@ class BlindNavigationApp(ObjectDetectionApp):
             print("🎯 Blind Navigation Assistant started!")
             print("🔊 Audio feedback enabled" if self.navigation_assistant.tts_engine else "📝 Text feedback mode")
             self.is_running = True
-            
+
             while self.is_running:
                 self._process_frame()
-                
-                # Check for quit command and additional controls
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q') or key == 27:  # 'q' or ESC key
+
+                # Poll for key commands without waitKey's built-in ~1 ms sleep
+                if not self._handle_key(cv2.pollKey() & 0xFF):
                     break
-                elif key == ord('v'):  # Toggle voice
-                    self._toggle_voice_feedback()
-                elif key == ord('s'):  # Save log
-                    self._save_current_log()
-                    
+
         except KeyboardInterrupt:
             print("\nNavigation assistant interrupted by user")
         except Exception as e:
@@ -716,6 +1217,24 @@ class BlindNavigationApp(ObjectDetectionApp):
         finally:
             self._cleanup()
     
+    def _handle_key(self, key: int) -> bool:
+        """
+        Dispatch a polled key command.
+
+        Args:
+            key: Masked key code from cv2.pollKey
+
+        Returns:
+            bool: False when the app should quit, True otherwise
+        """
+        if key == ord('q') or key == 27:  # 'q' or ESC key
+            return False
+        elif key == ord('v'):  # Toggle voice
+            self._toggle_voice_feedback()
+        elif key == ord('s'):  # Save log
+            self._save_current_log()
+        return True
+
     def _toggle_voice_feedback(self):
         """Toggle voice feedback on/off."""
         if self.navigation_assistant.tts_engine:
@@ -3,6 +3,7 @@ OpenCV camera implementation.
 """
 import cv2
 import numpy as np
+import threading
 from typing import Optional, Tuple
 from .camera_interface import CameraInterface
 
@@ -28,6 +29,13 @@ class OpenCVCamera(CameraInterface):
         self.width = width
         self.height = height
         self.cap: Optional[cv2.VideoCapture] = None
+
+        # Grabber thread state: the thread continually reads the device
+        # and publishes the newest frame into a single latest-wins slot
+        self._latest: Optional[np.ndarray] = None
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
     
     def initialize(self) -> bool:
         """
@@ -37,41 +45,82 @@ class OpenCVCamera(CameraInterface):
             bool: True if initialization successful, False otherwise
         """
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
+            # Prefer the native V4L2 backend on Linux - the FFmpeg fallback
+            # buffers aggressively and adds seconds of latency
+            self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_V4L2)
+            if not self.cap.isOpened():
+                # Fall back to whatever backend is available
+                self.cap = cv2.VideoCapture(self.camera_index)
             if not self.cap.isOpened():
                 return False
-            
+
             # Set camera properties
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
-            
+
+            # Keep the driver queue at one frame so capture_frame returns
+            # the current frame instead of one buffered ~100 ms ago
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            # MJPG avoids the driver-side YUV->BGR conversion path
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
+            # Start the background grabber so the pipeline never blocks
+            # the device and always consumes the freshest frame
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._grab_loop, daemon=True)
+            self._thread.start()
+
             return True
         except Exception as e:
             print(f"Error initializing camera: {e}")
             return False
     
+    def _grab_loop(self) -> None:
+        """Continuously read the device, keeping only the newest frame."""
+        while not self._stop_event.is_set():
+            ret, frame = self.cap.read()
+            if ret:
+                with self._cond:
+                    self._latest = frame
+                    self._cond.notify_all()
+            else:
+                # Back off briefly so a failing device doesn't spin
+                self._stop_event.wait(0.005)
+
     def capture_frame(self) -> Optional[np.ndarray]:
         """
         Capture a single frame from the camera.
-        
+
+        Returns the newest frame published by the grabber thread, waiting
+        briefly when the pipeline outpaces the camera. Each frame is
+        delivered at most once.
+
         Returns:
             Optional[np.ndarray]: The captured frame, or None if capture failed
         """
         if not self.cap or not self.cap.isOpened():
             return None
-        
-        ret, frame = self.cap.read()
-        if not ret:
-            return None
-        
+
+        with self._cond:
+            if self._latest is None:
+                self._cond.wait(timeout=1.0)
+            frame = self._latest
+            self._latest = None
+
         return frame
-    
+
     def release(self) -> None:
         """Release the camera resources."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
         if self.cap:
             self.cap.release()
             self.cap = None
+        self._latest = None
     
     def is_opened(self) -> bool:
         """
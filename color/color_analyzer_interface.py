@@ -34,6 +34,23 @@ class ColorAnalyzerInterface(ABC):
         """
         pass
     
+    def analyze_colors(self, image: np.ndarray,
+                       detected_objects: List[DetectedObject]) -> List[Color]:
+        """
+        Analyze the colors of a batch of detected objects.
+
+        Implementations may override this to share per-frame work (e.g. a
+        single color-space conversion) across all objects.
+
+        Args:
+            image: Original image
+            detected_objects: Detected objects to analyze
+
+        Returns:
+            List[Color]: Analyzed color information, one per object
+        """
+        return [self.analyze_color(image, obj) for obj in detected_objects]
+
     @abstractmethod
     def get_supported_colors(self) -> List[str]:
         """
@@ -3,13 +3,51 @@ HSV-based color analysis implementation.
 """
 import cv2
 import numpy as np
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from typing import Dict, Tuple, List
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, List
 from .color_analyzer_interface import ColorAnalyzerInterface
 from models import Color, DetectedObject
 from processing import ImageProcessor
+from utils_numba import NUMBA_AVAILABLE, adjust_color_scores
+
+
+# Baseline color definitions shared by every analyzer instance. Each
+# instance copies these into plain dicts so add_color_definition can
+# extend one analyzer without affecting the others.
+# Format: (lower_bound, upper_bound) where each bound is (H, S, V)
+_COLOR_RANGES: Tuple[Tuple[str, Tuple[Tuple[int, int, int], Tuple[int, int, int]]], ...] = (
+    ('red', ((0, 50, 50), (10, 255, 255))),
+    ('red2', ((170, 50, 50), (180, 255, 255))),  # Red wraps around in HSV
+    ('orange', ((11, 50, 50), (25, 255, 255))),
+    ('yellow', ((26, 50, 50), (35, 255, 255))),
+    ('green', ((36, 50, 50), (85, 255, 255))),
+    ('cyan', ((86, 50, 50), (95, 255, 255))),
+    ('blue', ((96, 50, 50), (125, 255, 255))),
+    ('purple', ((126, 50, 50), (145, 255, 255))),
+    ('pink', ((146, 50, 50), (169, 255, 255))),
+    ('white', ((0, 0, 200), (180, 30, 255))),
+    ('black', ((0, 0, 0), (180, 255, 50))),
+    ('gray', ((0, 0, 51), (180, 30, 199))),
+)
+
+# RGB representations for colors (for visualization)
+_COLOR_RGB: Tuple[Tuple[str, Tuple[int, int, int]], ...] = (
+    ('red', (255, 0, 0)),
+    ('red2', (255, 0, 0)),
+    ('orange', (255, 165, 0)),
+    ('yellow', (255, 255, 0)),
+    ('green', (0, 255, 0)),
+    ('cyan', (0, 255, 255)),
+    ('blue', (0, 0, 255)),
+    ('purple', (128, 0, 128)),
+    ('pink', (255, 192, 203)),
+    ('white', (255, 255, 255)),
+    ('black', (0, 0, 0)),
+    ('gray', (128, 128, 128)),
+)
 
 
 class HSVColorAnalyzer(ColorAnalyzerInterface):
@@ -23,40 +61,70 @@ class HSVColorAnalyzer(ColorAnalyzerInterface):
     def __init__(self):
         """Initialize the HSV color analyzer with predefined color ranges."""
         self.image_processor = ImageProcessor()
-        
-        # Define HSV color ranges for common colors
-        # Format: (lower_bound, upper_bound) where each bound is (H, S, V)
-        self.color_ranges: Dict[str, Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = {
-            'red': ((0, 50, 50), (10, 255, 255)),
-            'red2': ((170, 50, 50), (180, 255, 255)),  # Red wraps around in HSV
-            'orange': ((11, 50, 50), (25, 255, 255)),
-            'yellow': ((26, 50, 50), (35, 255, 255)),
-            'green': ((36, 50, 50), (85, 255, 255)),
-            'cyan': ((86, 50, 50), (95, 255, 255)),
-            'blue': ((96, 50, 50), (125, 255, 255)),
-            'purple': ((126, 50, 50), (145, 255, 255)),
-            'pink': ((146, 50, 50), (169, 255, 255)),
-            'white': ((0, 0, 200), (180, 30, 255)),
-            'black': ((0, 0, 0), (180, 255, 50)),
-            'gray': ((0, 0, 51), (180, 30, 199))
-        }
-        
-        # Define RGB representations for colors (for visualization)
-        self.color_rgb: Dict[str, Tuple[int, int, int]] = {
-            'red': (255, 0, 0),
-            'red2': (255, 0, 0),
-            'orange': (255, 165, 0),
-            'yellow': (255, 255, 0),
-            'green': (0, 255, 0),
-            'cyan': (0, 255, 255),
-            'blue': (0, 0, 255),
-            'purple': (128, 0, 128),
-            'pink': (255, 192, 203),
-            'white': (255, 255, 255),
-            'black': (0, 0, 0),
-            'gray': (128, 128, 128)
-        }
+
+        # Worker pool for batch analysis: the heavy lifting per ROI is
+        # OpenCV C code that releases the GIL, so objects can be analyzed
+        # concurrently
+        self._pool = ThreadPoolExecutor(max_workers=4)
+
+        # Small LRU of recent classifications keyed by a cheap 64-bit ROI
+        # signature: objects that persist across frames with unchanged
+        # pixels skip re-analysis entirely
+        self._color_cache: OrderedDict = OrderedDict()
+        self._color_cache_max = 64
+        self._cache_lock = threading.Lock()
+
+        # Per-instance copies of the shared baseline definitions so
+        # add_color_definition can mutate them safely
+        self.color_ranges: Dict[str, Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = \
+            dict(_COLOR_RANGES)
+        self.color_rgb: Dict[str, Tuple[int, int, int]] = dict(_COLOR_RGB)
+
+        # Single-pass classification tables: pixel hues map to chromatic
+        # color ids through one lookup, so classification reads the ROI
+        # once instead of running an inRange pass per color
+        self._build_classification_tables()
     
+    def _build_classification_tables(self) -> None:
+        """Precompute the hue lookup table and color-id assignments."""
+        # Stable id per color name (red2 folds into red), with a trailing
+        # id for pixels that match no class
+        self._id_names = [name for name in self.color_ranges if name != 'red2']
+        color_ids = {name: i for i, name in enumerate(self._id_names)}
+        self._name_ids = color_ids
+        self._unknown_id = len(self._id_names)
+
+        # RGB per color id (trailing entry is the default gray for
+        # 'unknown'), so the hot path indexes an array instead of hashing
+        # a string key into color_rgb
+        self._rgb_table = np.asarray(
+            [self.color_rgb.get(name, (128, 128, 128)) for name in self._id_names]
+            + [(128, 128, 128)], dtype=np.uint8)
+        self._white_id = color_ids['white']
+        self._black_id = color_ids['black']
+        self._gray_id = color_ids['gray']
+
+        # Hue -> chromatic color id (achromatic classes are resolved from
+        # saturation/value instead of hue)
+        self._hue_lut = np.full(256, self._unknown_id, dtype=np.uint8)
+        for name, (lower, upper) in self.color_ranges.items():
+            if name in ('white', 'black', 'gray'):
+                continue
+            target = color_ids['red' if name == 'red2' else name]
+            self._hue_lut[lower[0]:upper[0] + 1] = target
+
+        # Per-id primary hue spans for the dominant-hue confidence boost
+        self._hue_lo = np.array([self.color_ranges[name][0][0]
+                                 for name in self._id_names], np.int16)
+        self._hue_hi = np.array([self.color_ranges[name][1][0]
+                                 for name in self._id_names], np.int16)
+
+        if NUMBA_AVAILABLE:
+            # Pre-warm the score-adjustment kernel
+            adjust_color_scores(np.zeros(len(self._id_names)),
+                                self._hue_lo, self._hue_hi, 0, 0.0, 0.0,
+                                self._white_id, self._black_id, self._gray_id)
+
     def analyze_color(self, image: np.ndarray, detected_object: DetectedObject) -> Color:
         """
         Analyze the color of a detected object using HSV color space.
@@ -70,15 +138,70 @@ class HSVColorAnalyzer(ColorAnalyzerInterface):
         """
         # Extract the region of interest (ROI) from the image
         roi = self._extract_roi(image, detected_object)
-        
+
         # Convert ROI to HSV
         hsv_roi = self.image_processor.convert_to_hsv(roi)
-        
-        # Find the dominant color in the ROI
-        dominant_color = self._find_dominant_color(hsv_roi)
-        
-        return dominant_color
+
+        # Find the dominant color inside the object's contour
+        mask = self._object_mask(detected_object, hsv_roi.shape[:2])
+        return self._find_dominant_color(hsv_roi, mask)
     
+    def analyze_colors(self, image: np.ndarray,
+                       detected_objects: List[DetectedObject]) -> List[Color]:
+        """
+        Analyze the colors of a batch of detected objects.
+
+        Converts the full frame to HSV once and analyzes each object's ROI
+        as a view into it, instead of converting per object. With more than
+        one object the ROIs are analyzed in parallel on the worker pool.
+
+        Args:
+            image: Original image
+            detected_objects: Detected objects to analyze
+
+        Returns:
+            List[Color]: Analyzed color information, one per object
+        """
+        if not detected_objects:
+            return []
+
+        hsv_image = self.image_processor.convert_to_hsv(image)
+
+        def analyze_one(obj: DetectedObject) -> Color:
+            hsv_roi = self._extract_roi(hsv_image, obj)
+            return self._find_dominant_color(
+                hsv_roi, self._object_mask(obj, hsv_roi.shape[:2]))
+
+        # Thread dispatch only pays off when there is real parallel work:
+        # multiple objects and enough total pixels to amortize the overhead
+        total_area = sum(obj.bounding_box.area for obj in detected_objects)
+        if len(detected_objects) < 2 or total_area < 65536:
+            return [analyze_one(obj) for obj in detected_objects]
+
+        # Submit the largest ROIs first so a big straggler doesn't start
+        # last and extend the critical path; results are returned in the
+        # caller's original object order
+        order = sorted(range(len(detected_objects)),
+                       key=lambda i: detected_objects[i].bounding_box.area,
+                       reverse=True)
+        mapped = self._pool.map(analyze_one,
+                                (detected_objects[i] for i in order))
+        colors: List[Color] = [None] * len(detected_objects)
+        for i, color in zip(order, mapped):
+            colors[i] = color
+        return colors
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=False)
+
+    def __del__(self):
+        """Best-effort pool cleanup when the analyzer is garbage-collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def get_supported_colors(self) -> List[str]:
         """
         Get the list of supported color names.
@@ -100,17 +223,22 @@ class HSVColorAnalyzer(ColorAnalyzerInterface):
         self.color_ranges[name] = hsv_range
         # Default RGB representation (can be customized)
         self.color_rgb[name] = (128, 128, 128)
+        # Rebuild the lookup tables so the new color participates in
+        # single-pass classification
+        self._build_classification_tables()
     
     def _extract_roi(self, image: np.ndarray, detected_object: DetectedObject) -> np.ndarray:
         """
         Extract the region of interest from the image.
-        
+
         Args:
             image: Original image
             detected_object: Detected object
-            
+
         Returns:
-            np.ndarray: Extracted ROI
+            np.ndarray: Extracted ROI - a zero-copy view into the image.
+            Treat it as read-only; cv2 consumers (cvtColor, inRange, resize)
+            handle row-aligned strided views without an intermediate copy.
         """
         bbox = detected_object.bounding_box
         
@@ -121,112 +249,150 @@ class HSVColorAnalyzer(ColorAnalyzerInterface):
         x_end = min(image.shape[1], bbox.x + bbox.width)
         
         return image[y_start:y_end, x_start:x_end]
-    
-    def _find_dominant_color(self, hsv_roi: np.ndarray) -> Color:
+
+    def _object_mask(self, detected_object: DetectedObject,
+                     roi_shape: Tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Get the filled-contour mask for the object's ROI.
+
+        Restricting classification to the contour interior keeps
+        background pixels inside the bounding rectangle from biasing the
+        color histogram. The mask is cached on the object so repeat
+        analyses pay nothing.
+
+        Args:
+            detected_object: Detected object
+            roi_shape: (height, width) of the extracted ROI
+
+        Returns:
+            Optional[np.ndarray]: uint8 mask, or None if no usable contour
+        """
+        contour = detected_object.contour
+        if contour is None or len(contour) < 3:
+            return None
+
+        mask = detected_object._roi_mask
+        if mask is not None and mask.shape == roi_shape:
+            return mask
+
+        bbox = detected_object.bounding_box
+        mask = np.zeros(roi_shape, np.uint8)
+        # Contour points are in frame coordinates; shift them into the
+        # (clamped) ROI frame used by _extract_roi
+        shifted = contour - np.array([max(0, bbox.x), max(0, bbox.y)])
+        cv2.drawContours(mask, [shifted], -1, 255, -1)
+        detected_object._roi_mask = mask
+        return mask
+
+    def _find_dominant_color(self, hsv_roi: np.ndarray,
+                             mask: Optional[np.ndarray] = None) -> Color:
         """
         Find the dominant color in the HSV ROI with improved accuracy.
         
         Args:
             hsv_roi: HSV region of interest
-            
+            mask: Optional uint8 mask restricting analysis to the object's
+                contour interior
+
         Returns:
             Color: Dominant color information
         """
         if hsv_roi.size == 0:
             return Color(128, 128, 128, "unknown", 0.0)
-        
+
+        # Short-circuit on the signature of an 8x8 thumbnail: static
+        # objects re-hit their cached Color at ~0 cost
+        signature = hashlib.blake2b(
+            cv2.resize(hsv_roi, (8, 8), interpolation=cv2.INTER_AREA).tobytes(),
+            digest_size=8).digest()
+        with self._cache_lock:
+            cached = self._color_cache.get(signature)
+            if cached is not None:
+                self._color_cache.move_to_end(signature)
+                return cached
+
+        # Classification only needs a color distribution, not every pixel:
+        # shrink large ROIs to 64x64 with area averaging so the cost is
+        # constant regardless of bounding-box size
+        roi_height, roi_width = hsv_roi.shape[:2]
+        if roi_height * roi_width > 4096:
+            hsv_roi = cv2.resize(hsv_roi, (64, 64), interpolation=cv2.INTER_AREA)
+            if mask is not None:
+                mask = cv2.resize(mask, (64, 64), interpolation=cv2.INTER_NEAREST)
+
         # Apply noise reduction
         hsv_roi_filtered = cv2.medianBlur(hsv_roi, 5)
-        
-        # Calculate histogram for better color analysis
-        hist_h = cv2.calcHist([hsv_roi_filtered], [0], None, [180], [0, 180])
-        hist_s = cv2.calcHist([hsv_roi_filtered], [1], None, [256], [0, 256])
-        hist_v = cv2.calcHist([hsv_roi_filtered], [2], None, [256], [0, 256])
-        
+
+        # Classify every pixel in one pass: chromatic pixels map to a
+        # color id through the hue LUT, achromatic pixels are resolved
+        # from their saturation/value, and everything else is 'unknown'
+        h, s, v = cv2.split(hsv_roi_filtered)
+        ids = np.where((s >= 50) & (v >= 50), self._hue_lut[h], self._unknown_id)
+        low_sat = s <= 30
+        ids[v <= 50] = self._black_id
+        ids[low_sat & (v >= 200)] = self._white_id
+        ids[low_sat & (v > 50) & (v < 200)] = self._gray_id
+
+        # Restrict the statistics to the contour interior so background
+        # pixels in the bounding rectangle can't dilute the histogram
+        if mask is not None and cv2.countNonZero(mask) > 0:
+            inside = mask != 0
+            ids[~inside] = self._unknown_id
+            total_pixels = int(np.count_nonzero(inside))
+            hue_pixels = h[inside]
+        else:
+            mask = None
+            total_pixels = ids.size
+            hue_pixels = h.ravel()
+
+        # Per-color pixel fractions from a single histogram of the id image
+        counts = np.bincount(ids.ravel(), minlength=self._unknown_id + 1)
+        scores = counts[:self._unknown_id] / total_pixels
+
         # Get dominant hue
-        dominant_hue = np.argmax(hist_h)
-        
-        best_match = None
-        best_confidence = 0
-        best_color_name = "unknown"
-        color_scores = {}
-        
-        for color_name, (lower, upper) in self.color_ranges.items():
-            # Create mask for this color range
-            mask = cv2.inRange(hsv_roi_filtered, np.array(lower), np.array(upper))
-            
-            # Calculate the percentage of pixels matching this color
-            pixel_count = cv2.countNonZero(mask)
-            total_pixels = hsv_roi_filtered.shape[0] * hsv_roi_filtered.shape[1]
-            base_confidence = pixel_count / total_pixels if total_pixels > 0 else 0
-            
-            # Special handling for red (which has two ranges in HSV)
-            if color_name == 'red2' and 'red' in self.color_ranges:
-                # Combine with the first red range
-                continue
-            elif color_name == 'red':
-                # Also check the second red range
-                if 'red2' in self.color_ranges:
-                    lower2, upper2 = self.color_ranges['red2']
-                    mask2 = cv2.inRange(hsv_roi_filtered, np.array(lower2), np.array(upper2))
-                    pixel_count += cv2.countNonZero(mask2)
-                    base_confidence = pixel_count / total_pixels if total_pixels > 0 else 0
-            
-            # Apply histogram-based confidence boost
-            hue_range = range(lower[0], upper[0] + 1)
-            if dominant_hue in hue_range:
-                base_confidence *= 1.2  # Boost confidence if dominant hue matches
-            
-            # Consider saturation and value for better detection
-            mean_s = np.mean(hsv_roi_filtered[:, :, 1])
-            mean_v = np.mean(hsv_roi_filtered[:, :, 2])
-            
-            # Adjust confidence based on saturation and brightness
-            if mean_s > 50 and mean_v > 50:  # Good color conditions
-                base_confidence *= 1.1
-            elif mean_s < 30:  # Low saturation (grayish)
-                if color_name in ['white', 'black', 'gray']:
-                    base_confidence *= 1.2
-                else:
-                    base_confidence *= 0.8
-            elif mean_v < 50:  # Low brightness
-                if color_name == 'black':
-                    base_confidence *= 1.3
-                else:
-                    base_confidence *= 0.9
-            elif mean_v > 200:  # High brightness
-                if color_name == 'white':
-                    base_confidence *= 1.3
-                else:
-                    base_confidence *= 0.9
-            
-            color_scores[color_name] = base_confidence
-            
-            if base_confidence > best_confidence:
-                best_confidence = base_confidence
-                best_color_name = color_name
-                best_match = mask
-        
+        dominant_hue = int(np.bincount(hue_pixels, minlength=180).argmax())
+
+        # Consider saturation and value for better detection; cv2.mean
+        # reduces all channels in one SIMD pass over the buffer
+        _, mean_s, mean_v, _ = cv2.mean(hsv_roi_filtered, mask=mask)
+
+        # Apply the per-color confidence adjustments and pick the winner in
+        # one compiled pass over the score vector (pure Python fallback
+        # when numba is unavailable)
+        best_id = adjust_color_scores(scores, self._hue_lo, self._hue_hi,
+                                      dominant_hue, mean_s, mean_v,
+                                      self._white_id, self._black_id,
+                                      self._gray_id)
+        best_confidence = scores[best_id]
+        best_color_name = self._id_names[best_id] if best_confidence > 0 else "unknown"
+
         # Additional validation: check if confidence is too low
         if best_confidence < 0.1:
             # Analyze average color if no clear match
             mean_hsv = self.get_average_color_in_roi(hsv_roi_filtered)
             best_color_name = self._classify_by_average_hsv(mean_hsv)
+            best_id = self._name_ids.get(best_color_name, self._unknown_id)
             best_confidence = 0.5  # Medium confidence for average-based classification
-        
-        # Get RGB values for the detected color
-        if best_color_name in self.color_rgb:
-            r, g, b = self.color_rgb[best_color_name]
-        else:
-            r, g, b = 128, 128, 128  # Default gray
-        
-        return Color(
+
+        # RGB for the detected color comes straight from the id table
+        r, g, b = (int(c) for c in self._rgb_table[best_id])
+
+        color = Color(
             r=r,
             g=g,
             b=b,
             name=best_color_name,
             confidence=min(best_confidence, 1.0)  # Cap at 1.0
         )
+
+        # Remember the result so identical-looking ROIs (static objects
+        # across consecutive frames) skip the full analysis next time
+        with self._cache_lock:
+            self._color_cache[signature] = color
+            while len(self._color_cache) > self._color_cache_max:
+                self._color_cache.popitem(last=False)
+
+        return color
     
     def get_average_color_in_roi(self, hsv_roi: np.ndarray) -> Tuple[int, int, int]:
         """
@@ -240,10 +406,10 @@ class HSVColorAnalyzer(ColorAnalyzerInterface):
         """
         if hsv_roi.size == 0:
             return (0, 0, 0)
-        
-        # Calculate mean HSV values
-        mean_hsv = np.mean(hsv_roi.reshape(-1, 3), axis=0)
-        return tuple(mean_hsv.astype(int))
+
+        # cv2.mean reads the buffer once with no reshape copy
+        mean_hsv = cv2.mean(hsv_roi)
+        return (int(mean_hsv[0]), int(mean_hsv[1]), int(mean_hsv[2]))
     
     def _classify_by_average_hsv(self, hsv_values: Tuple[int, int, int]) -> str:
         """
@@ -8,6 +8,13 @@ import os
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# Prefer the libyaml C implementations - an order of magnitude faster to
+# parse/dump than the pure-Python loaders they mirror
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 class ConfigManager:
     """
@@ -31,6 +38,7 @@ class ConfigManager:
             self.config_dir = Path(config_dir)
         
         self._configs: Dict[str, Dict[str, Any]] = {}
+        self._mtimes: Dict[str, int] = {}
     
     def load_config(self, config_name: str) -> Dict[str, Any]:
         """
@@ -56,8 +64,9 @@ class ConfigManager:
         
         try:
             with open(config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
+                config_data = yaml.load(file, Loader=_YamlLoader)
                 self._configs[config_name] = config_data
+                self._mtimes[config_name] = config_path.stat().st_mtime_ns
                 return config_data
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in {config_path}: {e}")
@@ -122,6 +131,34 @@ class ConfigManager:
         """
         if config_name in self._configs:
             del self._configs[config_name]
+            self._mtimes.pop(config_name, None)
+        return self.load_config(config_name)
+
+    def reload_if_changed(self, config_name: str) -> Dict[str, Any]:
+        """
+        Reload a configuration only if its file changed on disk.
+
+        Cheap enough to poll every frame for live-tunable parameters:
+        when the file's mtime matches the cached value the call costs a
+        single stat and the cached dict is returned without re-parsing.
+
+        Args:
+            config_name: Name of the configuration to check
+
+        Returns:
+            Dict[str, Any]: Current configuration data
+        """
+        cached = self._configs.get(config_name)
+        if cached is not None:
+            config_path = self.config_dir / f"{config_name}.yaml"
+            try:
+                mtime = config_path.stat().st_mtime_ns
+            except OSError:
+                # File vanished - keep serving the cached config
+                return cached
+            if mtime == self._mtimes.get(config_name):
+                return cached
+            del self._configs[config_name]
         return self.load_config(config_name)
     
     def save_config(self, config_name: str, config_data: Dict[str, Any]) -> None:
@@ -138,7 +175,9 @@ class ConfigManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         with open(config_path, 'w', encoding='utf-8') as file:
-            yaml.dump(config_data, file, default_flow_style=False, indent=2)
+            yaml.dump(config_data, file, Dumper=_YamlDumper,
+                      default_flow_style=False, indent=2)
         
         # Update cached config
         self._configs[config_name] = config_data
+        self._mtimes[config_name] = config_path.stat().st_mtime_ns
@@ -10,15 +10,16 @@ from shape import GeometricShapeAnalyzer
 
 def create_simple_test():
     """Create a simple test image."""
-    # Create a black background with white shapes
-    image = np.zeros((400, 600, 3), dtype=np.uint8)
-    
+    # The content is purely grayscale, so build it as a single-channel
+    # image directly - one third the memory and no BGR->gray conversion
+    image = np.zeros((400, 600), dtype=np.uint8)
+
     # Large white circle
-    cv2.circle(image, (150, 200), 80, (255, 255, 255), -1)
-    
+    cv2.circle(image, (150, 200), 80, 255, -1)
+
     # Large white rectangle
-    cv2.rectangle(image, (300, 120), (450, 280), (255, 255, 255), -1)
-    
+    cv2.rectangle(image, (300, 120), (450, 280), 255, -1)
+
     return image
 
 
@@ -37,8 +38,8 @@ def debug_detection():
     # Initialize detector with lower area threshold
     detector = ContourDetector(min_contour_area=100, max_contour_area=100000)
     
-    # Debug the preprocessing step
-    gray = cv2.cvtColor(test_image, cv2.COLOR_BGR2GRAY)
+    # Debug the preprocessing step - the test image is already grayscale
+    gray = test_image
     cv2.imwrite("debug_gray.jpg", gray)
     
     # Apply Gaussian blur
@@ -63,12 +64,13 @@ def debug_detection():
     
     print(f"Valid contours after filtering: {len(valid_contours)}")
     
-    # Now test the full detection pipeline
+    # Now test the full detection pipeline - the detector accepts the
+    # grayscale image directly
     detected_objects = detector.detect_objects(test_image)
     print(f"Detected objects from pipeline: {len(detected_objects)}")
-    
-    # Create visualization
-    vis_image = test_image.copy()
+
+    # Promote to BGR only for the colored visualization
+    vis_image = cv2.cvtColor(test_image, cv2.COLOR_GRAY2BGR)
     for i, contour in enumerate(valid_contours):
         cv2.drawContours(vis_image, [contour], -1, (0, 255, 0), 2)
         # Add contour number
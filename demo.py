@@ -3,17 +3,25 @@ Demo script for the object detection system without requiring a camera.
 This creates synthetic test images to demonstrate the functionality.
 """
 import cv2
+import functools
 import numpy as np
 import time
 from detection import ContourDetector
 from color import HSVColorAnalyzer
 from models import DetectionResult
 from config import ConfigManager
-from utils import VisualizationUtils
+from utils import VisualizationUtils, load_or_build_test_image
 
 
+@functools.lru_cache(maxsize=1)
 def create_test_image_with_colored_objects():
-    """Create a test image with colored objects."""
+    """Create a test image with colored objects (cached after first build)."""
+    return load_or_build_test_image('demo_colored_objects',
+                                    _draw_test_image_with_colored_objects)
+
+
+def _draw_test_image_with_colored_objects():
+    """Render the demo scene with OpenCV draw calls."""
     # Create a white background
     img = np.ones((480, 640, 3), dtype=np.uint8) * 255
     
@@ -67,10 +75,12 @@ def run_demo():
     detected_objects = detector.detect_objects(test_image)
     print(f"✅ Found {len(detected_objects)} objects")
     
-    # Analyze colors
+    # Analyze colors in one batch - the analyzer converts the frame to
+    # HSV once and spreads the per-object work across its thread pool
     print("🎨 Analyzing colors...")
-    for i, obj in enumerate(detected_objects):
-        obj.color = color_analyzer.analyze_color(test_image, obj)
+    colors = color_analyzer.analyze_colors(test_image, detected_objects)
+    for i, (obj, color) in enumerate(zip(detected_objects, colors)):
+        obj.color = color
         obj.object_id = i + 1
         print(f"  Object {obj.object_id}: {obj.color.name} (confidence: {obj.color.confidence:.2f}, area: {obj.area})")
     
@@ -99,36 +109,66 @@ def run_demo():
     cv2.destroyAllWindows()
 
 
-def visualize_detection_results(detection_result: DetectionResult) -> np.ndarray:
-    """Visualize detection results."""
-    frame = detection_result.frame.copy()
-    
-    for obj in detection_result.objects:
+# Rendered label bitmaps keyed by label text: OpenCV font rasterization
+# is the slowest part of the draw loop, and labels repeat across frames
+# for objects with stable ids, so each is rendered once and then blitted
+_label_cache = {}
+
+
+def _get_label_bitmap(label: str) -> np.ndarray:
+    """Get the rendered bitmap (black background, white text) for a label."""
+    bitmap = _label_cache.get(label)
+    if bitmap is None:
+        if len(_label_cache) > 256:
+            _label_cache.clear()
+        (tw, th), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+        bitmap = np.zeros((th + 10, tw, 3), dtype=np.uint8)
+        cv2.putText(bitmap, label, (0, th + 5),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        _label_cache[label] = bitmap
+    return bitmap
+
+
+def visualize_detection_results(detection_result: DetectionResult,
+                                out: np.ndarray = None) -> np.ndarray:
+    """
+    Visualize detection results.
+
+    The source frame is left untouched; drawing happens on `out`, which
+    callers rendering a live stream should pass in and reuse so a fresh
+    HxWx3 buffer isn't allocated every frame.
+    """
+    source = detection_result.frame
+    if out is None or out.shape != source.shape:
+        out = np.empty_like(source)
+    np.copyto(out, source)
+    frame = out
+
+    # Shared (N, 4) bbox array: the draw loop reads plain ints from one
+    # contiguous buffer instead of chasing BoundingBox attributes
+    bboxes = detection_result.bbox_array
+
+    for obj, (x, y, w, h) in zip(detection_result.objects, bboxes):
         # Draw bounding box
-        bbox = obj.bounding_box
-        cv2.rectangle(frame, 
-                     (bbox.x, bbox.y), 
-                     (bbox.x + bbox.width, bbox.y + bbox.height),
-                     (255, 255, 255), 2)
-        
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 255, 255), 2)
+
         # Draw contours
         cv2.drawContours(frame, [obj.contour], -1, (0, 255, 0), 2)
-        
-        # Draw color label
+
+        # Draw color label: blit the cached bitmap (background included)
+        # instead of re-rasterizing the text every frame
         if obj.color:
             label = f"ID:{obj.object_id} {obj.color.name} ({obj.color.confidence:.2f})"
-            label_pos = (bbox.x, bbox.y - 10)
-            
-            # Background for text
-            text_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-            cv2.rectangle(frame,
-                         (label_pos[0], label_pos[1] - text_size[1] - 5),
-                         (label_pos[0] + text_size[0], label_pos[1] + 5),
-                         (0, 0, 0), -1)
-            
-            # Text
-            cv2.putText(frame, label, label_pos,
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            bitmap = _get_label_bitmap(label)
+            bh, bw = bitmap.shape[:2]
+            x1, y2 = x, y - 5
+            y1 = y2 - bh
+            # Clip to the frame so labels near the border don't wrap
+            fy1, fx1 = max(y1, 0), max(x1, 0)
+            fy2, fx2 = min(y2, frame.shape[0]), min(x1 + bw, frame.shape[1])
+            if fy2 > fy1 and fx2 > fx1:
+                frame[fy1:fy2, fx1:fx2] = bitmap[fy1 - y1:fy2 - y1,
+                                                 fx1 - x1:fx2 - x1]
     
     # Add title
     title = f"Object Detection Demo - {len(detection_result.objects)} objects detected"
@@ -3,8 +3,10 @@ Object detection application orchestrator.
 This module follows the Single Responsibility Principle by focusing
 on orchestrating the entire object detection pipeline.
 """
+import collections
 import cv2
 import numpy as np
+import threading
 import time
 from typing import List, Optional
 from camera import CameraInterface, OpenCVCamera
@@ -61,6 +63,15 @@ class ObjectDetectionApp:
         # Display settings
         self.display_config = self.detection_config.get('display', {})
         self.window_name = self.display_config.get('window_name', 'Object Color Detector')
+
+        # Latest-wins handoff to the display thread: detection publishes
+        # results here and never blocks on drawing or imshow
+        self._display_q = collections.deque(maxlen=1)
+        self._display_thread: Optional[threading.Thread] = None
+
+        # Measured label sizes keyed by (text, scale, thickness): labels
+        # repeat across frames, so each is measured once
+        self._text_size_cache = {}
     
     def run(self) -> None:
         """
@@ -73,12 +84,18 @@ class ObjectDetectionApp:
             
             print("Object Color Detector started. Press 'q' to quit.")
             self.is_running = True
-            
+
+            # Run visualization and imshow on their own thread so GUI
+            # work never stalls the detection loop
+            self._display_thread = threading.Thread(
+                target=self._display_loop, name='display', daemon=True)
+            self._display_thread.start()
+
             while self.is_running:
                 self._process_frame()
                 
-                # Check for quit command
-                key = cv2.waitKey(1) & 0xFF
+                # Check for quit command without waitKey's built-in ~1 ms sleep
+                key = cv2.pollKey() & 0xFF
                 if key == ord('q') or key == 27:  # 'q' or ESC key
                     break
                     
@@ -116,9 +133,17 @@ class ObjectDetectionApp:
         detector_config = self.detection_config.get('detection', {}).get('contour', {})
         self.detector.set_parameters(**detector_config)
         
-        # Create OpenCV window
-        cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
-        
+        # Create OpenCV window. Prefer an OpenGL-backed window with VSYNC
+        # off so imshow blits instead of waiting for the 60 Hz display
+        # refresh; fall back to the plain window on builds without OpenGL
+        try:
+            cv2.namedWindow(self.window_name,
+                            cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+            if hasattr(cv2, 'WND_PROP_VSYNC'):
+                cv2.setWindowProperty(self.window_name, cv2.WND_PROP_VSYNC, 0)
+        except cv2.error:
+            cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
+
         return True
     
     def _process_frame(self) -> None:
@@ -130,12 +155,14 @@ class ObjectDetectionApp:
         
         # Detect objects
         detected_objects = self.detector.detect_objects(frame)
-        
-        # Analyze colors and shapes for each detected object
-        for obj in detected_objects:
-            obj.color = self.color_analyzer.analyze_color(frame, obj)
-            obj.shape = self.shape_analyzer.analyze_shape(obj)
-        
+
+        # Analyze colors and shapes for all detected objects in one batch
+        colors = self.color_analyzer.analyze_colors(frame, detected_objects)
+        shapes = self.shape_analyzer.analyze_shapes(detected_objects)
+        for obj, color, shape in zip(detected_objects, colors, shapes):
+            obj.color = color
+            obj.shape = shape
+
         # Create detection result
         detection_result = DetectionResult(
             objects=detected_objects,
@@ -143,14 +170,23 @@ class ObjectDetectionApp:
             timestamp=time.time()
         )
         
-        # Visualize results
-        display_frame = self._visualize_results(detection_result)
-        
-        # Show frame
-        cv2.imshow(self.window_name, display_frame)
-        
+        # Publish for the display thread; an unrendered older result is
+        # simply replaced by the newest one
+        self._display_q.append(detection_result)
+
         # Update frame counter and FPS
         self._update_fps()
+
+    def _display_loop(self) -> None:
+        """Render and show results as the detection loop publishes them."""
+        while self.is_running:
+            try:
+                detection_result = self._display_q.popleft()
+            except IndexError:
+                time.sleep(0.001)
+                continue
+            display_frame = self._visualize_results(detection_result)
+            cv2.imshow(self.window_name, display_frame)
     
     def _visualize_results(self, detection_result: DetectionResult) -> np.ndarray:
         """
@@ -163,7 +199,7 @@ class ObjectDetectionApp:
             np.ndarray: Frame with visualizations
         """
         frame = detection_result.frame.copy()
-        
+
         # Get display settings
         show_contours = self.display_config.get('show_contours', True)
         show_bboxes = self.display_config.get('show_bounding_boxes', True)
@@ -171,49 +207,66 @@ class ObjectDetectionApp:
         show_shapes = self.display_config.get('show_shape_labels', True)
         font_scale = self.display_config.get('font_scale', 0.7)
         thickness = self.display_config.get('line_thickness', 2)
-        
-        for obj in detection_result.objects:
-            # Draw contours
-            if show_contours:
-                cv2.drawContours(frame, [obj.contour], -1, (0, 255, 0), thickness)
-            
-            # Draw bounding box
-            if show_bboxes:
-                bbox = obj.bounding_box
-                cv2.rectangle(frame, 
-                            (bbox.x, bbox.y), 
-                            (bbox.x + bbox.width, bbox.y + bbox.height),
-                            (255, 0, 0), thickness)
-            
+
+        objects = detection_result.objects
+
+        # Draw every contour in one C call instead of one per object
+        if show_contours and objects:
+            cv2.drawContours(frame, [obj.contour for obj in objects],
+                             -1, (0, 255, 0), thickness)
+
+        # Shared (N, 4) [x, y, w, h] array: the loops below read plain
+        # ints instead of chasing BoundingBox attributes per object
+        bboxes = detection_result.bbox_array
+
+        if show_bboxes:
+            for x, y, w, h in bboxes:
+                cv2.rectangle(frame, (x, y), (x + w, y + h),
+                              (255, 0, 0), thickness)
+
+        for obj, (x, y, _, _) in zip(objects, bboxes):
             # Prepare labels
             labels = []
             if show_labels and obj.color:
                 labels.append(f"{obj.color.name} ({obj.color.confidence:.2f})")
             if show_shapes and obj.shape:
                 labels.append(f"{obj.shape.name} ({obj.shape.confidence:.2f})")
-            
+
             # Draw labels
-            if labels:
-                y_offset = obj.bounding_box.y - 10
-                for i, label in enumerate(labels):
-                    label_pos = (obj.bounding_box.x, y_offset - (i * 25))
-                    
-                    # Draw text background
-                    text_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0]
-                    cv2.rectangle(frame,
-                                (label_pos[0], label_pos[1] - text_size[1] - 5),
-                                (label_pos[0] + text_size[0], label_pos[1] + 5),
-                                (0, 0, 0), -1)
-                    
-                    # Draw text
-                    cv2.putText(frame, label, label_pos,
-                              cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), thickness)
+            y_offset = y - 10
+            for i, label in enumerate(labels):
+                label_pos = (x, y_offset - (i * 25))
+
+                # Draw text background; getTextSize results are cached
+                # per label string since labels repeat across frames
+                text_size = self._get_text_size(label, font_scale, thickness)
+                cv2.rectangle(frame,
+                            (label_pos[0], label_pos[1] - text_size[1] - 5),
+                            (label_pos[0] + text_size[0], label_pos[1] + 5),
+                            (0, 0, 0), -1)
+
+                # Draw text
+                cv2.putText(frame, label, label_pos,
+                          cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), thickness)
         
         # Draw statistics
         self._draw_statistics(frame, detection_result)
-        
+
         return frame
-    
+
+    def _get_text_size(self, label: str, font_scale: float,
+                       thickness: int) -> tuple:
+        """Get the (width, height) of a label, cached by its parameters."""
+        key = (label, font_scale, thickness)
+        size = self._text_size_cache.get(key)
+        if size is None:
+            if len(self._text_size_cache) > 256:
+                self._text_size_cache.clear()
+            size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX,
+                                   font_scale, thickness)[0]
+            self._text_size_cache[key] = size
+        return size
+
     def _draw_statistics(self, frame: np.ndarray, detection_result: DetectionResult) -> None:
         """
         Draw statistics on the frame.
@@ -249,6 +302,8 @@ class ObjectDetectionApp:
     def _cleanup(self) -> None:
         """Clean up resources."""
         self.is_running = False
+        if self._display_thread is not None and self._display_thread.is_alive():
+            self._display_thread.join(timeout=1.0)
         if self.camera:
             self.camera.release()
         cv2.destroyAllWindows()
@@ -1,6 +1,7 @@
 """
 Response models for the mobile vision API.
 """
+import numpy as np
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
@@ -44,6 +45,110 @@ class DetectionResponse(BaseModel):
     message: str
 
 
+class BatchDetectedObjects:
+    """
+    Structure-of-arrays storage for a batch of detected objects.
+
+    Instead of N per-object pydantic models (one validated __init__ each),
+    the batch keeps one NumPy array per field. Pydantic objects are only
+    assembled on demand via to_objects(); the fast path is to_payload(),
+    which serializes each field with a single tolist() call.
+    """
+
+    __slots__ = ('ids', 'bbox_xywh', 'center_xy', 'area', 'confidence',
+                 'color_names', 'color_confidence', 'color_rgb')
+
+    def __init__(self,
+                 ids: np.ndarray,
+                 bbox_xywh: np.ndarray,
+                 center_xy: np.ndarray,
+                 area: np.ndarray,
+                 confidence: np.ndarray,
+                 color_names: List[str],
+                 color_confidence: np.ndarray,
+                 color_rgb: np.ndarray):
+        self.ids = ids                            # (N,) int32
+        self.bbox_xywh = bbox_xywh                # (N, 4) int32
+        self.center_xy = center_xy                # (N, 2) float32
+        self.area = area                          # (N,) int32
+        self.confidence = confidence              # (N,) float32
+        self.color_names = color_names            # length-N list
+        self.color_confidence = color_confidence  # (N,) float32
+        self.color_rgb = color_rgb                # (N, 3) uint8
+
+    @classmethod
+    def from_results(cls, results: List[Dict[str, Any]]) -> 'BatchDetectedObjects':
+        """Gather the detector's per-object dicts into field arrays."""
+        n = len(results)
+        return cls(
+            ids=np.fromiter((r['id'] for r in results),
+                            dtype=np.int32, count=n),
+            bbox_xywh=np.fromiter(
+                ((r['bbox']['x'], r['bbox']['y'],
+                  r['bbox']['width'], r['bbox']['height'])
+                 for r in results),
+                dtype=np.dtype((np.int32, 4)), count=n),
+            center_xy=np.fromiter(
+                ((r['center']['x'], r['center']['y']) for r in results),
+                dtype=np.dtype((np.float32, 2)), count=n),
+            area=np.fromiter((r['area'] for r in results),
+                             dtype=np.int32, count=n),
+            confidence=np.fromiter((r['confidence'] for r in results),
+                                   dtype=np.float32, count=n),
+            color_names=[r['color']['name'] for r in results],
+            color_confidence=np.fromiter(
+                (r['color']['confidence'] for r in results),
+                dtype=np.float32, count=n),
+            color_rgb=np.fromiter(
+                (r['color']['rgb'] for r in results),
+                dtype=np.dtype((np.uint8, 3)), count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Serialize as a dict of plain lists, one tolist() per field."""
+        return {
+            'count': len(self.ids),
+            'ids': self.ids.tolist(),
+            'bbox_xywh': self.bbox_xywh.tolist(),
+            'center_xy': self.center_xy.tolist(),
+            'area': self.area.tolist(),
+            'confidence': self.confidence.tolist(),
+            'color_names': self.color_names,
+            'color_confidence': self.color_confidence.tolist(),
+            'color_rgb': self.color_rgb.tolist(),
+        }
+
+    def to_objects(self) -> List[DetectedObject]:
+        """Assemble the per-object pydantic models (slow path, on demand)."""
+        return [
+            DetectedObject(
+                id=int(self.ids[i]),
+                bbox=BoundingBox(x=int(self.bbox_xywh[i, 0]),
+                                 y=int(self.bbox_xywh[i, 1]),
+                                 width=int(self.bbox_xywh[i, 2]),
+                                 height=int(self.bbox_xywh[i, 3])),
+                center=Point(x=float(self.center_xy[i, 0]),
+                             y=float(self.center_xy[i, 1])),
+                area=int(self.area[i]),
+                color=ColorInfo(name=self.color_names[i],
+                                confidence=float(self.color_confidence[i]),
+                                rgb=self.color_rgb[i].tolist()),
+                confidence=float(self.confidence[i]),
+            )
+            for i in range(len(self.ids))
+        ]
+
+    def to_response(self, message: str = '') -> DetectionResponse:
+        """Build the full pydantic DetectionResponse from the arrays."""
+        return DetectionResponse(success=True,
+                                 objects=self.to_objects(),
+                                 message=message or
+                                 f"Detected {len(self.ids)} objects")
+
+
 class Face(BaseModel):
     """Detected face information."""
     id: int
@@ -3,6 +3,8 @@ Face detection using MediaPipe.
 """
 import cv2
 import numpy as np
+import os
+import threading
 from typing import List, Dict, Any
 import asyncio
 import logging
@@ -14,6 +16,16 @@ except ImportError:
     MEDIAPIPE_AVAILABLE = False
     logging.warning("MediaPipe not available. Face detection will use OpenCV cascade.")
 
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Path to an UltraFace-style (optionally int8-quantized) face detection
+# model; when set and present, it replaces the Haar cascade fallback
+FACE_ONNX_MODEL_ENV = "FACE_ONNX_MODEL"
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +36,23 @@ class FaceDetector:
         """Initialize face detector."""
         self.is_initialized = False
         self.use_mediapipe = MEDIAPIPE_AVAILABLE
-        
+
+        # Serializes the sync core: the MediaPipe graph, the cascade
+        # and the scratch buffers below are not thread-safe, and
+        # asyncio.to_thread may run concurrent requests on this instance
+        self._detect_lock = threading.Lock()
+
+        # Color-conversion scratch buffers, reallocated only when the
+        # frame shape changes: at video rate the per-call cvtColor
+        # allocation is pure churn. Only touched under _detect_lock.
+        self._rgb_buf = None
+        self._gray_buf = None
+
+        # ONNX Runtime session (loaded in initialize() when a model is
+        # configured); preferred over the cascade fallback
+        self.onnx_session = None
+        self._onnx_input_name = None
+
         if self.use_mediapipe:
             self.mp_face_detection = mp.solutions.face_detection
             self.mp_drawing = mp.solutions.drawing_utils
@@ -36,6 +64,15 @@ class FaceDetector:
     async def initialize(self):
         """Initialize the face detector."""
         try:
+            # A quantized ONNX detector (UltraFace-style) beats the Haar
+            # cascade by a wide margin on CPU; load it when configured
+            model_path = os.environ.get(FACE_ONNX_MODEL_ENV, "")
+            if ONNX_AVAILABLE and model_path and os.path.isfile(model_path):
+                self.onnx_session = ort.InferenceSession(
+                    model_path, providers=["CPUExecutionProvider"])
+                self._onnx_input_name = self.onnx_session.get_inputs()[0].name
+                logger.info(f"ONNX face detector loaded from {model_path}")
+
             if self.use_mediapipe:
                 self.face_detection = self.mp_face_detection.FaceDetection(
                     model_selection=0, min_detection_confidence=0.5
@@ -61,55 +98,81 @@ class FaceDetector:
     async def detect(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """
         Detect faces in image.
-        
+
+        The MediaPipe/OpenCV work runs on a worker thread so the event
+        loop stays free to serve other requests.
+
         Args:
             image: Input image (BGR format)
-            
+
         Returns:
             List of detected faces with landmarks
         """
         if not self.is_initialized:
             return []
-        
-        try:
-            if self.use_mediapipe and self.face_detection:
-                return await self._detect_with_mediapipe(image)
-            elif self.face_cascade is not None:
-                return await self._detect_with_opencv(image)
-            else:
-                # Fallback: simple mock detection for demonstration
-                return await self._detect_mock(image)
-            
-        except Exception as e:
-            logger.error(f"Face detection error: {e}")
-            return []
-    
-    async def _detect_with_mediapipe(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._detect_sync, image)
+
+    def _detect_sync(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Synchronous detection core (runs off the event loop).
+
+        Serialized by _detect_lock: concurrent requests queue here while
+        the event loop itself stays free.
+        """
+        with self._detect_lock:
+            try:
+                if self.use_mediapipe and self.face_detection:
+                    return self._detect_with_mediapipe(image)
+                elif self.onnx_session is not None:
+                    return self._detect_with_onnx(image)
+                elif self.face_cascade is not None:
+                    # Deprecated Haar-cascade fallback; prefer the ONNX path
+                    return self._detect_with_opencv(image)
+                else:
+                    # Fallback: simple mock detection for demonstration
+                    return self._detect_mock(image)
+
+            except Exception as e:
+                logger.error(f"Face detection error: {e}")
+                return []
+
+    def _detect_with_mediapipe(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Detect faces using MediaPipe."""
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = self.face_detection.process(rgb_image)
+        if self._rgb_buf is None or self._rgb_buf.shape != image.shape:
+            self._rgb_buf = np.empty_like(image)
+        cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        results = self.face_detection.process(self._rgb_buf)
         
         faces = []
         if results.detections:
+            h, w = image.shape[:2]
+            scale = np.array([w, h], dtype=np.float32)
+
             for i, detection in enumerate(results.detections):
-                bbox = detection.location_data.relative_bounding_box
-                h, w = image.shape[:2]
-                
+                location = detection.location_data
+                bbox = location.relative_bounding_box
+
                 # Convert relative coordinates to absolute
                 x = int(bbox.xmin * w)
                 y = int(bbox.ymin * h)
                 width = int(bbox.width * w)
                 height = int(bbox.height * h)
-                
-                # Get landmarks if available
+
+                # Get landmarks if available: gather the relative
+                # keypoints into a small local array, scale to pixels
+                # in one vectorized pass, and leave Python-object
+                # creation to a single tolist() at the boundary
                 landmarks = []
-                if hasattr(detection.location_data, 'relative_keypoints'):
-                    for landmark in detection.location_data.relative_keypoints:
-                        landmarks.append({
-                            "x": landmark.x * w,
-                            "y": landmark.y * h
-                        })
-                
+                if hasattr(location, 'relative_keypoints'):
+                    keypoints = location.relative_keypoints
+                    coords = np.empty((len(keypoints), 2),
+                                      dtype=np.float32)
+                    for j, keypoint in enumerate(keypoints):
+                        coords[j, 0] = keypoint.x
+                        coords[j, 1] = keypoint.y
+                    coords *= scale
+                    landmarks = [{"x": px, "y": py}
+                                 for px, py in coords.tolist()]
+
                 face_data = {
                     "id": i,
                     "bbox": {
@@ -125,9 +188,72 @@ class FaceDetector:
         
         return faces
     
-    async def _detect_with_opencv(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _detect_with_onnx(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Detect faces with an UltraFace-style ONNX Runtime session."""
+        h, w = image.shape[:2]
+
+        # UltraFace preprocessing: 320x240 RGB, (x - 127) / 128, NCHW
+        resized = cv2.resize(image, (320, 240))
+        blob = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB).astype(np.float32)
+        blob = (blob - 127.0) / 128.0
+        blob = blob.transpose(2, 0, 1)[np.newaxis]
+
+        confidences, boxes = self.onnx_session.run(
+            None, {self._onnx_input_name: blob})
+        scores = confidences[0, :, 1]
+        boxes = boxes[0]  # Normalized [x1, y1, x2, y2]
+
+        keep = scores > 0.7
+        scores = scores[keep]
+        boxes = boxes[keep]
+        if len(boxes) == 0:
+            return []
+        picked = self._nms(boxes, scores)
+
+        faces = []
+        for i, idx in enumerate(picked):
+            x1, y1, x2, y2 = boxes[idx]
+            x = int(x1 * w)
+            y = int(y1 * h)
+            faces.append({
+                "id": i,
+                "bbox": {
+                    "x": x,
+                    "y": y,
+                    "width": int(x2 * w) - x,
+                    "height": int(y2 * h) - y
+                },
+                "confidence": float(scores[idx]),
+                "landmarks": []
+            })
+        return faces
+
+    @staticmethod
+    def _nms(boxes: np.ndarray, scores: np.ndarray,
+             iou_threshold: float = 0.4) -> List[int]:
+        """Greedy non-maximum suppression over [x1, y1, x2, y2] boxes."""
+        order = np.argsort(scores)[::-1]
+        areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        picked = []
+        while len(order) > 0:
+            i = order[0]
+            picked.append(int(i))
+            rest = order[1:]
+            xx1 = np.maximum(boxes[i, 0], boxes[rest, 0])
+            yy1 = np.maximum(boxes[i, 1], boxes[rest, 1])
+            xx2 = np.minimum(boxes[i, 2], boxes[rest, 2])
+            yy2 = np.minimum(boxes[i, 3], boxes[rest, 3])
+            inter = (np.maximum(0.0, xx2 - xx1)
+                     * np.maximum(0.0, yy2 - yy1))
+            iou = inter / (areas[i] + areas[rest] - inter + 1e-9)
+            order = rest[iou <= iou_threshold]
+        return picked
+
+    def _detect_with_opencv(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Detect faces using OpenCV cascade."""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if self._gray_buf is None or self._gray_buf.shape != image.shape[:2]:
+            self._gray_buf = np.empty(image.shape[:2], dtype=np.uint8)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
         faces_rects = self.face_cascade.detectMultiScale(
             gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
         )
@@ -149,7 +275,7 @@ class FaceDetector:
         
         return faces
     
-    async def _detect_mock(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _detect_mock(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Mock face detection for demonstration when no detector is available."""
         # Simple color-based face detection (skin tone detection)
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
@@ -159,31 +285,36 @@ class FaceDetector:
         upper_skin = np.array([20, 255, 255], dtype=np.uint8)
         
         mask = cv2.inRange(hsv, lower_skin, upper_skin)
-        
-        # Find contours
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+
+        # Label skin blobs in one pass: the stats array already carries
+        # bbox and area per component, so no per-contour Python calls
+        _, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        stats = stats[1:]  # Drop the background component
+
+        areas = stats[:, cv2.CC_STAT_AREA]
+        widths = stats[:, cv2.CC_STAT_WIDTH]
+        heights = stats[:, cv2.CC_STAT_HEIGHT]
+
+        # Minimum face area, and roughly square aspect ratio
+        # (0.7 <= w/h <= 1.3, written multiplicatively to stay in ints)
+        keep = ((areas > 1000)
+                & (widths * 10 >= heights * 7)
+                & (widths * 10 <= heights * 13))
+
         faces = []
-        for i, contour in enumerate(contours):
-            area = cv2.contourArea(contour)
-            if area > 1000:  # Minimum face area
-                x, y, w, h = cv2.boundingRect(contour)
-                
-                # Check aspect ratio (faces are roughly rectangular)
-                aspect_ratio = w / h
-                if 0.7 <= aspect_ratio <= 1.3:
-                    face_data = {
-                        "id": i,
-                        "bbox": {
-                            "x": int(x),
-                            "y": int(y),
-                            "width": int(w),
-                            "height": int(h)
-                        },
-                        "confidence": 0.6,
-                        "landmarks": [],
-                        "method": "skin_detection"
-                    }
-                    faces.append(face_data)
-        
-        return faces[:3]  # Limit to 3 faces
+        for i in np.flatnonzero(keep)[:3]:  # Limit to 3 faces
+            face_data = {
+                "id": int(i),
+                "bbox": {
+                    "x": int(stats[i, cv2.CC_STAT_LEFT]),
+                    "y": int(stats[i, cv2.CC_STAT_TOP]),
+                    "width": int(stats[i, cv2.CC_STAT_WIDTH]),
+                    "height": int(stats[i, cv2.CC_STAT_HEIGHT])
+                },
+                "confidence": 0.6,
+                "landmarks": [],
+                "method": "skin_detection"
+            }
+            faces.append(face_data)
+
+        return faces
@@ -1,8 +1,10 @@
 """
 Gesture recognition module for hand gestures.
 """
+import asyncio
 import math
 import numpy as np
+import threading
 from typing import List, Dict, Any
 import logging
 
@@ -17,7 +19,11 @@ class GestureRecognizer:
         self.is_initialized = False
         self.gesture_history = []
         self.history_size = 5
-        
+
+        # Guards gesture_history: asyncio.to_thread may run concurrent
+        # recognitions, and the history is read-modify-write state
+        self._recognize_lock = threading.Lock()
+
     async def initialize(self):
         """Initialize the gesture recognizer."""
         self.is_initialized = True
@@ -35,21 +41,26 @@ class GestureRecognizer:
         """
         if not self.is_initialized or len(landmarks) < 5:
             return {"name": "unknown", "confidence": 0.0}
-        
+        return await asyncio.to_thread(self._recognize_sync, landmarks)
+
+    def _recognize_sync(self, landmarks: List[Dict[str, float]]) -> Dict[str, Any]:
+        """Synchronous recognition core (runs off the event loop)."""
         try:
             # Analyze current gesture
             current_gesture = self._analyze_gesture(landmarks)
-            
-            # Add to history for temporal smoothing
-            self.gesture_history.append(current_gesture)
-            if len(self.gesture_history) > self.history_size:
-                self.gesture_history.pop(0)
-            
-            # Apply temporal smoothing
-            smoothed_gesture = self._smooth_gestures()
-            
+
+            # History update and smoothing are read-modify-write on
+            # shared state, so they run under the lock
+            with self._recognize_lock:
+                self.gesture_history.append(current_gesture)
+                if len(self.gesture_history) > self.history_size:
+                    self.gesture_history.pop(0)
+
+                # Apply temporal smoothing
+                smoothed_gesture = self._smooth_gestures()
+
             return smoothed_gesture
-            
+
         except Exception as e:
             logger.error(f"Gesture recognition error: {e}")
             return {"name": "unknown", "confidence": 0.0}
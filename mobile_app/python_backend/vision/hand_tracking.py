@@ -3,6 +3,7 @@ Hand tracking and gesture recognition using MediaPipe.
 """
 import cv2
 import numpy as np
+import threading
 from typing import List, Dict, Any, Tuple
 import asyncio
 import logging
@@ -25,7 +26,12 @@ class HandTracker:
         """Initialize hand tracker."""
         self.is_initialized = False
         self.use_mediapipe = MEDIAPIPE_AVAILABLE
-        
+
+        # Serializes the sync core: the MediaPipe graph is not
+        # thread-safe, and asyncio.to_thread may run concurrent
+        # requests on this instance
+        self._detect_lock = threading.Lock()
+
         if self.use_mediapipe:
             self.mp_hands = mp.solutions.hands
             self.mp_drawing = mp.solutions.drawing_utils
@@ -54,27 +60,38 @@ class HandTracker:
     async def detect(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """
         Detect hands in image.
-        
+
+        The MediaPipe/OpenCV work runs on a worker thread so the event
+        loop stays free to serve other requests.
+
         Args:
             image: Input image (BGR format)
-            
+
         Returns:
             List of detected hands with landmarks
         """
         if not self.is_initialized:
             return []
-        
-        try:
-            if self.use_mediapipe and self.hands:
-                return await self._detect_with_mediapipe(image)
-            else:
-                return await self._detect_basic(image)
-            
-        except Exception as e:
-            logger.error(f"Hand detection error: {e}")
-            return []
-    
-    async def _detect_with_mediapipe(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._detect_sync, image)
+
+    def _detect_sync(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Synchronous detection core (runs off the event loop).
+
+        Serialized by _detect_lock: concurrent requests queue here while
+        the event loop itself stays free.
+        """
+        with self._detect_lock:
+            try:
+                if self.use_mediapipe and self.hands:
+                    return self._detect_with_mediapipe(image)
+                else:
+                    return self._detect_basic(image)
+
+            except Exception as e:
+                logger.error(f"Hand detection error: {e}")
+                return []
+
+    def _detect_with_mediapipe(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Detect hands using MediaPipe."""
         rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         results = self.hands.process(rgb_image)
@@ -121,7 +138,7 @@ class HandTracker:
         
         return hands
     
-    async def _detect_basic(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _detect_basic(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Basic hand detection using skin color."""
         # Convert to HSV for skin detection
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
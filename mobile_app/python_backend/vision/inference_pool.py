@@ -0,0 +1,127 @@
+"""
+Process-pool inference workers for the mobile vision backend.
+
+Each worker process owns its own fully initialized detector set, so
+heavy OpenCV/MediaPipe inference runs truly in parallel across cores
+instead of contending for one interpreter's GIL. Frames cross the
+process boundary as the compressed JPEG/PNG bytes the client sent -
+small control messages that pickle in microseconds - and are decoded
+inside the worker, so raw ndarrays never need to be serialized.
+
+This module also hosts the decode/rescale helpers shared with the API
+layer, keeping it importable by worker processes without pulling in
+FastAPI.
+"""
+import asyncio
+import cv2
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+# Downscale-at-decode: the IMREAD_REDUCED_COLOR_* flags downsample
+# JPEGs during the IDCT itself, skipping the post-decode resize
+DECODE_REDUCTION_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# Reduced decode only pays off while the decoded frame stays at least
+# this tall; smaller inputs are re-decoded at full resolution
+MIN_DECODED_HEIGHT = 480
+
+
+def decode_image(buf, reduction: int = 1) -> Tuple[Optional[np.ndarray], int]:
+    """Decode an image, downsampling during decode when it stays large."""
+    nparr = np.frombuffer(buf, np.uint8)
+    factor = reduction if reduction in DECODE_REDUCTION_FLAGS else 1
+    image = cv2.imdecode(nparr, DECODE_REDUCTION_FLAGS[factor])
+    if image is not None and factor > 1 and image.shape[0] < MIN_DECODED_HEIGHT:
+        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        factor = 1
+    return image, factor
+
+
+def rescale_results(results: List[Dict[str, Any]],
+                    factor: int) -> List[Dict[str, Any]]:
+    """Scale detection coordinates back to the original resolution."""
+    if factor == 1:
+        return results
+    for result in results:
+        bbox = result.get("bbox")
+        if bbox:
+            for key in ("x", "y", "width", "height"):
+                bbox[key] = bbox[key] * factor
+        center = result.get("center")
+        if center:
+            center["x"] = center["x"] * factor
+            center["y"] = center["y"] * factor
+        if "area" in result:
+            result["area"] = result["area"] * factor * factor
+        for landmark in result.get("landmarks", ()):
+            landmark["x"] = landmark["x"] * factor
+            landmark["y"] = landmark["y"] * factor
+    return results
+
+
+# This worker process's detector set, built once by init_worker
+_detectors: Optional[Dict[str, Any]] = None
+
+
+def init_worker() -> None:
+    """ProcessPoolExecutor initializer: build this worker's detectors."""
+    global _detectors
+    from vision.object_detection import ObjectDetector
+    from vision.face_detection import FaceDetector
+    from vision.hand_tracking import HandTracker
+    from vision.gesture_recognition import GestureRecognizer
+
+    detectors = {
+        "objects": ObjectDetector(),
+        "faces": FaceDetector(),
+        "hands": HandTracker(),
+        "gestures": GestureRecognizer(),
+    }
+    loop = asyncio.new_event_loop()
+    try:
+        for detector in detectors.values():
+            loop.run_until_complete(detector.initialize())
+    finally:
+        loop.close()
+    _detectors = detectors
+
+
+def detect_objects(buf: bytes,
+                   reduction: int = 1) -> Optional[List[Dict[str, Any]]]:
+    """Decode and run object detection in this worker process."""
+    image, factor = decode_image(buf, reduction)
+    if image is None:
+        return None
+    return rescale_results(_detectors["objects"]._detect_sync(image), factor)
+
+
+def detect_faces(buf: bytes,
+                 reduction: int = 1) -> Optional[List[Dict[str, Any]]]:
+    """Decode and run face detection in this worker process."""
+    image, factor = decode_image(buf, reduction)
+    if image is None:
+        return None
+    return rescale_results(_detectors["faces"]._detect_sync(image), factor)
+
+
+def detect_hands(buf: bytes, reduction: int = 1
+                 ) -> Optional[Tuple[List[Dict[str, Any]],
+                                     List[Dict[str, Any]]]]:
+    """Decode and run hand detection plus gesture recognition."""
+    image, factor = decode_image(buf, reduction)
+    if image is None:
+        return None
+    hands = _detectors["hands"]._detect_sync(image)
+    recognizer = _detectors["gestures"]
+    gestures = [
+        recognizer._recognize_sync(hand["landmarks"])
+        if len(hand["landmarks"]) >= 5
+        else {"name": "unknown", "confidence": 0.0}
+        for hand in hands
+    ]
+    return rescale_results(hands, factor), gestures
@@ -3,6 +3,7 @@ Advanced object detection using YOLO and our existing modular system.
 """
 import cv2
 import numpy as np
+import threading
 from typing import List, Dict, Any
 import asyncio
 import logging
@@ -31,7 +32,12 @@ class ObjectDetector:
         )
         self.color_analyzer = HSVColorAnalyzer()
         self.is_initialized = False
-        
+
+        # Serializes the sync core: the contour detector reuses
+        # per-instance scratch buffers that are not thread-safe, and
+        # asyncio.to_thread may run concurrent requests on this instance
+        self._detect_lock = threading.Lock()
+
         # Performance settings
         self.max_objects = 10
         self.confidence_threshold = 0.3
@@ -51,13 +57,29 @@ class ObjectDetector:
     async def detect(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """
         Detect objects in image and return results.
-        
+
+        The OpenCV work runs on a worker thread so the event loop stays
+        free to serve other requests while detection is in flight.
+
         Args:
             image: Input image (BGR format)
-            
+
         Returns:
             List of detected objects with properties
         """
+        return await asyncio.to_thread(self._detect_sync, image)
+
+    def _detect_sync(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Synchronous detection core (runs off the event loop).
+
+        Serialized by _detect_lock: concurrent requests queue here while
+        the event loop itself stays free.
+        """
+        with self._detect_lock:
+            return self._detect_locked(image)
+
+    def _detect_locked(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Detection body; caller must hold _detect_lock."""
         try:
             # Resize image for better performance on mobile
             height, width = image.shape[:2]
@@ -69,6 +69,13 @@ class DetectedObject:
     shape: Optional[Shape] = None
     confidence: float = 1.0
     object_id: Optional[int] = None
+    # Cached name strings, resolved once per frame so hot paths avoid
+    # re-walking the color/shape attribute chains
+    color_name: Optional[str] = None
+    shape_name: Optional[str] = None
+    # Filled-contour mask for the object's ROI, built on demand by the
+    # color analyzer and cached here for repeat access
+    _roi_mask: Optional[np.ndarray] = None
     
     @property
     def center(self) -> Point:
@@ -87,10 +94,25 @@ class DetectionResult:
     objects: List[DetectedObject]
     frame: np.ndarray
     timestamp: float
-    
+    # Lazily built (N, 4) [x, y, w, h] array shared by every per-frame
+    # consumer, so the bounding boxes are gathered from the Python
+    # objects at most once per result
+    _bbox_array: Optional[np.ndarray] = None
+
     def __len__(self) -> int:
         """Get the number of detected objects."""
         return len(self.objects)
+
+    @property
+    def bbox_array(self) -> np.ndarray:
+        """Get all bounding boxes as one (N, 4) [x, y, w, h] int32 array."""
+        if self._bbox_array is None:
+            self._bbox_array = np.fromiter(
+                ((obj.bounding_box.x, obj.bounding_box.y,
+                  obj.bounding_box.width, obj.bounding_box.height)
+                 for obj in self.objects),
+                dtype=np.dtype((np.int32, 4)), count=len(self.objects))
+        return self._bbox_array
     
     def get_objects_by_color(self, color_name: str) -> List[DetectedObject]:
         """Get objects with a specific color."""
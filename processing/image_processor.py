@@ -15,7 +15,10 @@ class ImageProcessor:
     This class follows the Single Responsibility Principle by focusing
     solely on image processing tasks.
     """
-    
+
+    # Memoized HSV bound arrays keyed by (lower, upper) tuples
+    _bounds_cache = {}
+
     @staticmethod
     def resize_image(image: np.ndarray, width: int, height: int) -> np.ndarray:
         """
@@ -45,33 +48,37 @@ class ImageProcessor:
         return cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
     
     @staticmethod
-    def convert_to_gray(image: np.ndarray) -> np.ndarray:
+    def convert_to_gray(image: np.ndarray,
+                        dst: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Convert BGR image to grayscale.
-        
+
         Args:
             image: BGR image
-            
+            dst: Optional pre-allocated output buffer to write into
+
         Returns:
             np.ndarray: Grayscale image
         """
-        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=dst)
+
     @staticmethod
-    def apply_gaussian_blur(image: np.ndarray, kernel_size: int = 5) -> np.ndarray:
+    def apply_gaussian_blur(image: np.ndarray, kernel_size: int = 5,
+                            dst: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply Gaussian blur to reduce noise.
-        
+
         Args:
             image: Input image
             kernel_size: Size of the Gaussian kernel (must be odd)
-            
+            dst: Optional pre-allocated output buffer to write into
+
         Returns:
             np.ndarray: Blurred image
         """
         if kernel_size % 2 == 0:
             kernel_size += 1  # Ensure odd kernel size
-        return cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
+        return cv2.GaussianBlur(image, (kernel_size, kernel_size), 0, dst=dst)
     
     @staticmethod
     def apply_morphological_operations(mask: np.ndarray, 
@@ -116,7 +123,14 @@ class ImageProcessor:
         Returns:
             np.ndarray: Binary mask
         """
-        return cv2.inRange(hsv_image, np.array(lower_bound), np.array(upper_bound))
+        # Bound arrays are memoized per (lower, upper) pair so repeated
+        # masks for the same color range skip the per-call allocations
+        bounds = ImageProcessor._bounds_cache.get((lower_bound, upper_bound))
+        if bounds is None:
+            bounds = (np.asarray(lower_bound, np.uint8),
+                      np.asarray(upper_bound, np.uint8))
+            ImageProcessor._bounds_cache[(lower_bound, upper_bound)] = bounds
+        return cv2.inRange(hsv_image, bounds[0], bounds[1])
     
     @staticmethod
     def enhance_contrast(image: np.ndarray, alpha: float = 1.5, beta: int = 0) -> np.ndarray:
@@ -33,6 +33,20 @@ class ShapeAnalyzerInterface(ABC):
         """
         pass
     
+    def analyze_shapes(self, detected_objects: List[DetectedObject]) -> List[Shape]:
+        """
+        Analyze the shapes of a batch of detected objects.
+
+        Implementations may override this to batch per-object work.
+
+        Args:
+            detected_objects: Detected objects to analyze
+
+        Returns:
+            List[Shape]: Analyzed shape information, one per object
+        """
+        return [self.analyze_shape(obj) for obj in detected_objects]
+
     @abstractmethod
     def get_supported_shapes(self) -> List[str]:
         """
@@ -99,7 +99,7 @@ def test_zone_detection():
     print(f"   Zones with objects: {len(analysis['zone_analysis'])}")
     
     for zone, zone_data in analysis['zone_analysis'].items():
-        print(f"   {zone}: {zone_data['object_count']} objects ({zone_data['priority']} priority)")
+        print(f"   {zone}: {zone_data.object_count} objects ({zone_data.priority} priority)")
     
     print(f"\n🧭 Navigation Advice:")
     for advice in analysis['navigation_advice']:
@@ -3,6 +3,7 @@ Utility functions for the object detection system.
 """
 import cv2
 import numpy as np
+from pathlib import Path
 from typing import List, Tuple
 from models import DetectedObject, Color
 
@@ -226,3 +227,34 @@ class ColorUtils:
         normalized_distance = distance / max_distance
         
         return normalized_distance < threshold
+
+
+def load_or_build_test_image(cache_name: str, builder) -> np.ndarray:
+    """
+    Return a deterministic test image, drawing it at most once per machine.
+
+    The demo scenes are built from a fixed sequence of OpenCV draw calls,
+    so the result is serialized to ~/.cache/objdet on first use and
+    memory-mapped back on later runs, skipping the drawing entirely.
+    Falls back to building in memory if the cache directory is unusable.
+
+    Args:
+        cache_name: File stem used for the cached .npy
+        builder: Zero-argument callable that renders the image
+
+    Returns:
+        np.ndarray: The test image (read-only when served from cache)
+    """
+    cache_path = Path.home() / '.cache' / 'objdet' / f'{cache_name}.npy'
+    try:
+        return np.load(cache_path, mmap_mode='r')
+    except (OSError, ValueError):
+        pass
+
+    image = builder()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(cache_path, image)
+    except OSError:
+        pass
+    return image
@@ -0,0 +1,155 @@
+"""
+Optional Numba-compiled numeric kernels for the per-frame hot paths.
+
+Numba is an optional dependency: when it is installed, the kernels here
+are JIT-compiled loops; otherwise plain NumPy/Python implementations with
+identical semantics are used. Callers can check NUMBA_AVAILABLE to decide
+whether a warm-up call is worthwhile.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _adjust_color_scores_impl(scores, hue_lo, hue_hi, dominant_hue,
+                              mean_s, mean_v, white_id, black_id, gray_id):
+    """Apply per-color confidence adjustments in place; return the best id."""
+    best_id = 0
+    best_score = -1.0
+    for i in range(scores.shape[0]):
+        confidence = scores[i]
+
+        # Histogram-based confidence boost
+        if hue_lo[i] <= dominant_hue and dominant_hue <= hue_hi[i]:
+            confidence *= 1.2
+
+        # Adjust confidence based on saturation and brightness
+        if mean_s > 50 and mean_v > 50:     # Good color conditions
+            confidence *= 1.1
+        elif mean_s < 30:                   # Low saturation (grayish)
+            if i == white_id or i == black_id or i == gray_id:
+                confidence *= 1.2
+            else:
+                confidence *= 0.8
+        elif mean_v < 50:                   # Low brightness
+            confidence *= 1.3 if i == black_id else 0.9
+        elif mean_v > 200:                  # High brightness
+            confidence *= 1.3 if i == white_id else 0.9
+
+        scores[i] = confidence
+        if confidence > best_score:
+            best_score = confidence
+            best_id = i
+    return best_id
+
+
+if NUMBA_AVAILABLE:
+    adjust_color_scores = njit(cache=True)(_adjust_color_scores_impl)
+
+    @njit(parallel=True, cache=True)
+    def binarize_open(blurred, thresh, invert, eroded, out):
+        """Fused threshold + polarity invert + 3x3 elliptical opening.
+
+        Equivalent to cv2.threshold/bitwise_not/MORPH_OPEN but reads
+        the blurred image once and writes into caller-owned buffers, so
+        no intermediate full-frame arrays are allocated per call. A
+        pixel "passes" when (value > thresh) XOR invert; out-of-bounds
+        neighbors pass for the erosion and fail for the dilation,
+        matching OpenCV's default border values.
+        """
+        h, w = blurred.shape
+        for y in prange(h):
+            for x in range(w):
+                # Erosion over the 3x3 elliptical (cross) window, fused
+                # with the threshold: fail as soon as any neighbor fails
+                ok = (blurred[y, x] > thresh) != invert
+                if ok and y > 0:
+                    ok = (blurred[y - 1, x] > thresh) != invert
+                if ok and y < h - 1:
+                    ok = (blurred[y + 1, x] > thresh) != invert
+                if ok and x > 0:
+                    ok = (blurred[y, x - 1] > thresh) != invert
+                if ok and x < w - 1:
+                    ok = (blurred[y, x + 1] > thresh) != invert
+                eroded[y, x] = 255 if ok else 0
+        for y in prange(h):
+            for x in range(w):
+                # Dilation over the same cross window
+                v = eroded[y, x]
+                if v == 0:
+                    if y > 0 and eroded[y - 1, x] != 0:
+                        v = 255
+                    elif y < h - 1 and eroded[y + 1, x] != 0:
+                        v = 255
+                    elif x > 0 and eroded[y, x - 1] != 0:
+                        v = 255
+                    elif x < w - 1 and eroded[y, x + 1] != 0:
+                        v = 255
+                out[y, x] = v
+
+    @njit(parallel=True, cache=True)
+    def contour_confidences(areas, perimeters):
+        """Circularity-based confidence for a batch of contours."""
+        out = np.empty(areas.shape[0], np.float32)
+        for i in prange(areas.shape[0]):
+            p = perimeters[i]
+            if p > 0:
+                circularity = 4.0 * np.pi * areas[i] / (p * p)
+            else:
+                circularity = 0.0
+            out[i] = min(circularity * 2.0, 1.0)  # Normalize to [0, 1]
+        return out
+
+    @njit(cache=True)
+    def assign_zone_cells(bboxes, col_width, row_height, cols, rows):
+        """Compute (row, col) grid cells for an (N, 4) [x, y, w, h] array."""
+        n = bboxes.shape[0]
+        row_idx = np.empty(n, np.int64)
+        col_idx = np.empty(n, np.int64)
+        for i in range(n):
+            cx = bboxes[i, 0] + bboxes[i, 2] // 2
+            cy = bboxes[i, 1] + bboxes[i, 3] // 2
+            col_idx[i] = min(max(cx // col_width, 0), cols - 1)
+            row_idx[i] = min(max(cy // row_height, 0), rows - 1)
+        return row_idx, col_idx
+else:
+    adjust_color_scores = _adjust_color_scores_impl
+
+    def binarize_open(blurred, thresh, invert, eroded, out):
+        """Fused threshold + polarity invert + 3x3 elliptical opening."""
+        passes = (blurred > thresh) != invert
+        er = passes.copy()
+        er[1:, :] &= passes[:-1, :]
+        er[:-1, :] &= passes[1:, :]
+        er[:, 1:] &= passes[:, :-1]
+        er[:, :-1] &= passes[:, 1:]
+        di = er.copy()
+        di[1:, :] |= er[:-1, :]
+        di[:-1, :] |= er[1:, :]
+        di[:, 1:] |= er[:, :-1]
+        di[:, :-1] |= er[:, 1:]
+        np.multiply(er.view(np.uint8), 255, out=eroded)
+        np.multiply(di.view(np.uint8), 255, out=out)
+
+    def contour_confidences(areas, perimeters):
+        """Circularity-based confidence for a batch of contours."""
+        denom = np.where(perimeters > 0, perimeters * perimeters, 1.0)
+        circularity = np.where(perimeters > 0, 4.0 * np.pi * areas / denom, 0.0)
+        return np.minimum(circularity * 2.0, 1.0).astype(np.float32)
+
+    def assign_zone_cells(bboxes, col_width, row_height, cols, rows):
+        """Compute (row, col) grid cells for an (N, 4) [x, y, w, h] array."""
+        xs = bboxes[:, 0] + bboxes[:, 2] // 2
+        ys = bboxes[:, 1] + bboxes[:, 3] // 2
+        # Branchless binning: the cell index equals the number of grid
+        # boundaries at or below the center, summed from one boolean
+        # comparison matrix per axis
+        col_edges = np.arange(1, cols) * col_width
+        row_edges = np.arange(1, rows) * row_height
+        col_idx = (xs[:, None] >= col_edges).sum(axis=1)
+        row_idx = (ys[:, None] >= row_edges).sum(axis=1)
+        return row_idx, col_idx